@@ -17,14 +17,16 @@ def quick_test():
     print("🚀 Quick Test of Blockchain Tools")
     print("=" * 50)
     
-    # Test 1: Get available blockchains
+    # Test 1: Get available blockchains (fetched once and reused by the tests below)
     print("\n1️⃣ Testing available_blockchains_tool...")
+    blockchains = []
     try:
         result = blockchain_tools.available_blockchains_tool.invoke({})
         if result.get("error"):
             print(f"❌ Error: {result['error']}")
         else:
             print(f"✅ Available blockchains: {result['blockchains']}")
+            blockchains = result.get("blockchains", [])
     except Exception as e:
         print(f"❌ Exception: {e}")
     
@@ -32,7 +34,6 @@ def quick_test():
     print("\n2️⃣ Testing categories_by_gas_fees_tool...")
     try:
         # Use the first available blockchain
-        blockchains = blockchain_tools.available_blockchains_tool.invoke({}).get("blockchains", [])
         if blockchains:
             blockchain = blockchains[0]
             result = blockchain_tools.categories_by_gas_fees_tool.invoke({
@@ -52,7 +53,6 @@ def quick_test():
     # Test 3: Test contracts tool
     print("\n3️⃣ Testing top_contracts_by_gas_fees_tool...")
     try:
-        blockchains = blockchain_tools.available_blockchains_tool.invoke({}).get("blockchains", [])
         if blockchains:
             blockchain = blockchains[0]
             result = blockchain_tools.top_contracts_by_gas_fees_tool.invoke({
@@ -3,42 +3,48 @@ Blockchain Revenue Agent - Specialized in multi-task blockchain data analysis.
 Handles both category-level and contract-level analysis using onchain data tools.
 """
 
-from typing import Dict, Any, List
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional, Tuple
+from langchain_core.messages import HumanMessage
 from langgraph.prebuilt import create_react_agent
+from ..utils.agent_utils import error_update
+from ..utils.llm_utils import get_chat_model
 from ..schemas.state import AnalysisState, BlockchainCategoriesReport, TopContractsByCategoryReport, ContractInfo
-from ..tools.blockchain_tools import categories_by_gas_fees_tool, top_contracts_by_gas_fees_tool, get_latest_growthepie_datasets_tool, get_data_overview, get_combined_analysis, get_top_categories
-from datetime import datetime
+from ..tools.blockchain_tools import categories_by_gas_fees_tool, top_contracts_by_gas_fees_tool, top_contracts_by_gas_fees_batch_tool, get_top_categories, cached_invoke, tool_cache_key, tool_result_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
+import asyncio
+import json
 import logging
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
+# Fallback routing prompt; kept as a fixed template so the text only varies in the interpolated fields
+_FALLBACK_TEMPLATE = """Please analyze blockchain data:
 
-class BlockchainRevenueAgent:
-    """
-    Senior Blockchain Revenue Analyst specializing in multi-task data analysis.
-    Executes both category analysis and contract analysis tasks.
-    """
+Blockchains: {blockchains}
+Timeframe: {timeframe}
+Current status: {status}
 
-    def __init__(self, model_name: str = "gpt-4"):
-        self.model = ChatOpenAI(model=model_name, temperature=0.1)
-        self.name = "blockchain_revenue_agent"
+Determine if you need to perform category analysis or contract analysis and execute accordingly.
 
-        # Tools available to this agent
-        self.tools = [categories_by_gas_fees_tool, top_contracts_by_gas_fees_tool]
-
-        # Create the agent using LangGraph's prebuilt function
-        self.agent = create_react_agent(
-            model=self.model,
-            tools=self.tools,
-            prompt=self._get_system_prompt(),
-            name=self.name
-        )
+Finish with ONLY a JSON object of the form {{"next_task": "category_analysis" | "contract_analysis" | "done"}}."""
 
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt for the blockchain revenue agent"""
-        return """You are a Senior Blockchain Revenue Analyst specializing in multi-task data analysis using onchain data.
+# Tasks the fallback agent may hand back in its JSON decision
+_ROUTE_TASKS = frozenset({"category_analysis", "contract_analysis", "done"})
+
+# Case-insensitive task keywords, matched without lowercasing a copy of the (possibly long) text.
+# Category is always checked before contract, and no word boundaries are used since tasks look like "category_analysis"
+_CATEGORY_RE = re.compile("category", re.IGNORECASE)
+_CONTRACT_RE = re.compile("contract", re.IGNORECASE)
+_COMPLETE_RE = re.compile("complete", re.IGNORECASE)
+
+# Shared immutable result for the activity analysis, which currently has nothing to report
+_NO_ACTIVITIES: Tuple[str, ...] = ()
+
+_SYSTEM_PROMPT = """You are a Senior Blockchain Revenue Analyst specializing in multi-task data analysis using onchain data.
 
 EXPERTISE:
 - Deep knowledge of blockchain ecosystems and DeFi protocols
@@ -78,249 +84,345 @@ OUTPUT REQUIREMENTS:
 
 After completing your analysis, respond directly to the supervisor with structured findings."""
 
-    def execute_category_analysis(self, state: AnalysisState) -> AnalysisState:
+# Tool sets available to the react agent, keyed so they can be part of a cache key
+_TOOLS_BY_KEY = {
+    "blockchain_revenue": (categories_by_gas_fees_tool, top_contracts_by_gas_fees_tool),
+}
+
+
+@lru_cache(maxsize=8)
+def _build_react_agent(model_name: str, prompt: str, tools_key: str):
+    """Build the react agent once per (model, prompt, tool set) and reuse it across instances"""
+    return create_react_agent(
+        model=get_chat_model(model_name),
+        tools=list(_TOOLS_BY_KEY[tools_key]),
+        prompt=prompt,
+        name="blockchain_revenue_agent"
+    )
+
+
+class BlockchainRevenueAgent:
+    """
+    Senior Blockchain Revenue Analyst specializing in multi-task data analysis.
+    Executes both category analysis and contract analysis tasks.
+    """
+
+    def __init__(self, model_name: str = "gpt-4"):
+        self.model = get_chat_model(model_name)
+        self.name = "blockchain_revenue_agent"
+
+        # Tools available to this agent
+        self.tools = list(_TOOLS_BY_KEY["blockchain_revenue"])
+
+        # Reuse the agent built by LangGraph's prebuilt function for this model
+        self.agent = _build_react_agent(model_name, _SYSTEM_PROMPT, "blockchain_revenue")
+
+    def _get_system_prompt(self) -> str:
+        """Get the system prompt for the blockchain revenue agent"""
+        return _SYSTEM_PROMPT
+
+    def execute_category_analysis(self, state: AnalysisState) -> Dict[str, Any]:
         """Execute category analysis for all blockchains"""
         try:
-            blockchain_names = state['blockchain_names']
-            timeframe = state['timeframe']
-            
-            logger.info(f"💰 Starting Category Analysis")
-            logger.info("=" * 50)
-            logger.info(f"⛓️  Blockchains: {blockchain_names}")
-            logger.info(f"⏰ Timeframe: {timeframe}")
-
-            category_reports = []
-
-            for blockchain in blockchain_names:
-                # Use "7d" timeframe for blockchain analysis even when historical growthepie analysis is requested
-                analysis_timeframe = "7d" if timeframe in ["historical", "trend"] else timeframe
-                
-                logger.info(f"📊 Analyzing {blockchain} (using {analysis_timeframe} timeframe)...")
-                
-                # Fetch category data using the tool
-                category_data = categories_by_gas_fees_tool.invoke({
-                    "blockchain_name": blockchain,
-                    "timeframe": analysis_timeframe
-                })
-
-                # Check for errors in the response
-                if category_data.get("error"):
-                    error_msg = f"Error fetching data for {blockchain}: {category_data['error']}"
-                    logger.error(f"❌ {error_msg}")
-                    updated_state = state.copy()
-                    updated_state["errors"].append(f"Category Analysis: {error_msg}")
-                    return updated_state
-
-                # Create structured report
-                report = BlockchainCategoriesReport(
-                    blockchain=blockchain,
-                    timeframe=timeframe,
-                    top_category=category_data["top_category"],
-                    top_category_share=category_data["top_category_share"],
-                    category_breakdown=category_data["category_breakdown"],
-                    total_gas_fees_usd=category_data["total_gas_fees_usd"],
-                    category_concentration=category_data["category_concentration"],
-                    key_insights=self._generate_category_insights(category_data)
+            blockchain_names, timeframe, analysis_timeframe = self._start_category_analysis(state)
+
+            # Serve warm entries straight from the tool cache and only fetch the misses
+            # Results are written by index, so no locking is needed as futures complete
+            started_at = time.perf_counter()
+            category_results, misses = self._split_cached_categories(blockchain_names, analysis_timeframe)
+
+            # Fetch the remaining blockchains concurrently - each tool call is independent I/O
+            if misses:
+                with ThreadPoolExecutor(max_workers=min(16, len(misses))) as executor:
+                    futures = {
+                        executor.submit(cached_invoke, categories_by_gas_fees_tool, tool_args): index
+                        for index, tool_args in misses
+                    }
+                    for future in as_completed(futures):
+                        index = futures[future]
+                        try:
+                            category_results[index] = future.result()
+                        except Exception as e:
+                            category_results[index] = {"error": str(e)}
+
+            return self._build_category_state(state, blockchain_names, timeframe, analysis_timeframe, category_results, started_at)
+
+        except Exception as e:
+            logger.error("Category analysis error: %s", e)
+            return error_update(state, "Category Analysis", e)
+
+    async def aexecute_category_analysis(self, state: AnalysisState) -> Dict[str, Any]:
+        """Async variant of execute_category_analysis that fans the tool calls out with asyncio.gather"""
+        try:
+            blockchain_names, timeframe, analysis_timeframe = self._start_category_analysis(state)
+
+            started_at = time.perf_counter()
+            category_results, misses = self._split_cached_categories(blockchain_names, analysis_timeframe)
+
+            # The tools are synchronous, so each call runs in a worker thread while the event loop awaits them together
+            if misses:
+                results = await asyncio.gather(
+                    *(asyncio.to_thread(cached_invoke, categories_by_gas_fees_tool, tool_args) for _, tool_args in misses),
+                    return_exceptions=True
                 )
+                for (index, _), result in zip(misses, results):
+                    category_results[index] = {"error": str(result)} if isinstance(result, Exception) else result
 
-                category_reports.append(report)
-                logger.info(f"✅ {blockchain} category analysis completed")
+            return self._build_category_state(state, blockchain_names, timeframe, analysis_timeframe, category_results, started_at)
 
-            # Update state
-            updated_state = state.copy()
-            updated_state["category_reports"] = category_reports
-            updated_state["current_task"] = "category_analysis_complete"
+        except Exception as e:
+            logger.error("Category analysis error: %s", e)
+            return error_update(state, "Category Analysis", e)
+
+    def _start_category_analysis(self, state: AnalysisState) -> Tuple[List[str], str, str]:
+        """Log the start of category analysis and resolve the timeframe used for the tool calls"""
+        blockchain_names = state['blockchain_names']
+        timeframe = state['timeframe']
+
+        logger.info("💰 Starting Category Analysis")
+        logger.info("=" * 50)
+        logger.info("⛓️  Blockchains: %s", blockchain_names)
+        logger.info("⏰ Timeframe: %s", timeframe)
+
+        analysis_timeframe = self.analysis_timeframe(timeframe)
+        return blockchain_names, timeframe, analysis_timeframe
+
+    def _split_cached_categories(self, blockchain_names: List[str], analysis_timeframe: str) -> Tuple[List[Any], List[Tuple[int, Dict[str, Any]]]]:
+        """Fill in cached category results by index and return the (index, tool args) pairs still to fetch"""
+        category_results = [None] * len(blockchain_names)
+        misses = []
+        for index, blockchain in enumerate(blockchain_names):
+            tool_args = {"blockchain_name": blockchain, "timeframe": analysis_timeframe}
+            cached = tool_result_cache.get(tool_cache_key(categories_by_gas_fees_tool, tool_args))
+            if cached is None:
+                misses.append((index, tool_args))
+            else:
+                category_results[index] = cached
+        logger.debug("🗃️ Category data cache hits: %d/%d", len(blockchain_names) - len(misses), len(blockchain_names))
+        return category_results, misses
+
+    def _build_category_state(self, state: AnalysisState, blockchain_names: List[str], timeframe: str,
+                              analysis_timeframe: str, category_results: List[Dict[str, Any]], started_at: float) -> Dict[str, Any]:
+        """Turn the fetched category data into reports and build the state update"""
+        category_reports = []
+        errors = []
+
+        # Build reports in input order so results are deterministic regardless of completion order
+        for blockchain, category_data in zip(blockchain_names, category_results):
+            logger.debug("📊 Analyzed %s (using %s timeframe)", blockchain, analysis_timeframe)
+
+            # Check for errors in the response
+            if category_data.get("error"):
+                error_msg = f"Error fetching data for {blockchain}: {category_data['error']}"
+                logger.error("❌ %s", error_msg)
+                errors.append(f"Category Analysis: {error_msg}")
+                continue
+
+            # Create structured report
+            report = BlockchainCategoriesReport(
+                blockchain=blockchain,
+                timeframe=timeframe,
+                top_category=category_data["top_category"],
+                top_category_share=category_data["top_category_share"],
+                category_breakdown=category_data["category_breakdown"],
+                total_gas_fees_usd=category_data["total_gas_fees_usd"],
+                category_concentration=category_data["category_concentration"],
+                key_insights=self._generate_category_insights(category_data)
+            )
+
+            category_reports.append(report)
+            logger.debug("✅ %s category analysis completed", blockchain)
+
+        # Keep whatever succeeded; only fail the task when no blockchain produced a report
+        if not category_reports:
+            return {"errors": state["errors"] + errors, "current_task": "category_analysis_failed"}
+
+        logger.info("✅ Category analysis completed for %d/%d blockchains in %.2fs", len(category_reports), len(blockchain_names), time.perf_counter() - started_at)
+        logger.info("=" * 50)
+
+        # Return only the updated keys and let LangGraph merge them into the state
+        update = {"category_reports": category_reports, "current_task": "category_analysis_complete"}
+        if errors:
+            # Failed blockchains are reported as warnings so the workflow carries on with the partial reports
+            update["warnings"] = state.get("warnings", []) + errors
+        return update
+
+    def execute_contract_analysis(self, state: AnalysisState) -> Dict[str, Any]:
+        """Execute contract analysis for top categories in each blockchain"""
+        try:
+            timeframe, analysis_timeframe, pairs = self._plan_contract_analysis(state)
 
-            logger.info(f"✅ Category analysis completed for {len(category_reports)} blockchains")
-            logger.info("=" * 50)
-            return updated_state
+            started_at = time.perf_counter()
+            contract_reports = self._process_contract_pairs(pairs, timeframe, analysis_timeframe)
+            return self._build_contract_state(contract_reports, started_at)
 
         except Exception as e:
-            logger.error(f"Category analysis error: {str(e)}")
-            updated_state = state.copy()
-            updated_state["errors"].append(f"Category Analysis: {str(e)}")
-            return updated_state
+            logger.error("Contract analysis error: %s", e)
+            return error_update(state, "Contract Analysis", e)
 
-    def execute_contract_analysis(self, state: AnalysisState) -> AnalysisState:
-        """Execute contract analysis for top categories in each blockchain"""
+    async def aexecute_contract_analysis(self, state: AnalysisState) -> Dict[str, Any]:
+        """Async variant of execute_contract_analysis that runs the batched contract fetch off the event loop"""
         try:
-            logger.info(f"📄 Starting Contract Analysis")
-            logger.info("=" * 50)
-
-            # Check if we have target categories from trend analysis
-            target_categories = state.get("target_categories")
-            
-            if not state.get("category_reports") and not target_categories:
-                raise ValueError("Category analysis must be completed before contract analysis")
-
-            contract_reports = []
-
-            # If we have target categories from trend analysis, use those
-            if target_categories:
-                logger.info(f"🎯 Using target categories from trend analysis: {target_categories}")
-                categories_to_analyze = target_categories
-                blockchain_names = state.get("blockchain_names", [])
-                
-                logger.info(f"📊 Analyzing contracts for {len(blockchain_names)} blockchains × {len(categories_to_analyze)} categories")
-                
-                for blockchain in blockchain_names:
-                    for category in categories_to_analyze:
-                        # Use "7d" timeframe for blockchain analysis even when historical growthepie analysis is requested
-                        analysis_timeframe = "7d" if state['timeframe'] in ["historical", "trend"] else state['timeframe']
-                        
-                        logger.info(f"🔍 Analyzing {category} contracts on {blockchain} (using {analysis_timeframe} timeframe)...")
-                        
-                        # Fetch contract data using the tool
-                        contract_data = top_contracts_by_gas_fees_tool.invoke({
-                            "blockchain_name": blockchain,
-                            "timeframe": analysis_timeframe,
-                            "top_n": 10,  # Analyze top 10 contracts
-                            "main_category_key": category
-                        })
-                        
-                        if contract_data.get("error"):
-                            error_msg = f"Error fetching contract data for {blockchain}/{category}: {contract_data['error']}"
-                            logger.error(f"❌ {error_msg}")
-                            updated_state = state.copy()
-                            updated_state["errors"].append(f"Contract Analysis: {error_msg}")
-                            return updated_state
-                        
-                        contracts_found = len(contract_data.get("top_contracts", []))
-                        logger.info(f"📋 Found {contracts_found} contracts for {category} on {blockchain}")
-                        # print(contract_data["top_contracts"])
-                        # Convert contract data to structured format
-                        contracts = []
-                        for contract_info in contract_data["top_contracts"]:
-                            contract = ContractInfo(
-                                address=contract_info["address"],
-                                project_name=contract_info.get("project_name"),
-                                name=contract_info.get("name"),
-                                gas_fees_absolute_usd=contract_info["gas_fees_absolute_usd"],
-                                main_category_key=contract_info["main_category_key"],
-                                sub_category_key=contract_info.get("sub_category_key"),
-                                chain=contract_info.get("chain"),
-                                gas_fees_absolute_eth=contract_info.get("gas_fees_absolute_eth"),
-                                txcount_absolute=contract_info.get("txcount_absolute")
-                            )
-                            contracts.append(contract)
-
-                        # Create structured report
-                        report = TopContractsByCategoryReport(
-                            blockchain=blockchain,
-                            category=category,
-                            timeframe=state['timeframe'],
-                            top_contracts=contracts,
-                            total_contracts_analyzed=contract_data["total_contracts_analyzed"],
-                            top_contract_share=contract_data["top_contract_share"],
-                            contract_concentration=contract_data["contract_concentration"],
-                            key_insights=self._generate_contract_insights(contract_data),
-                            activity_analysis=self._analyze_contract_activities(contracts)
-                        )
-
-                        contract_reports.append(report)
-                        logger.info(f"✅ {category} contract analysis completed for {blockchain}")
-                
-                logger.info(f"✅ Contract analysis completed for {len(contract_reports)} category-blockchain combinations")
-                logger.info("=" * 50)
-                
-                # Update state
-                updated_state = state.copy()
-                updated_state["contract_reports"] = contract_reports
-                updated_state["current_task"] = "contract_analysis_complete"
-                return updated_state
-                
-            else:
-                # Use original logic with category reports
-                logger.info("📊 Using category reports to determine top categories...")
-                for category_report in state["category_reports"]:
-                    # Get top 2 categories for this blockchain
-                    top_categories = get_top_categories(category_report.category_breakdown, n=2)
-                    logger.info(f"🎯 Top categories for {category_report.blockchain}: {top_categories}")
-
-                    for category in top_categories:
-                        # Use "7d" timeframe for blockchain analysis even when historical growthepie analysis is requested
-                        analysis_timeframe = "7d" if state['timeframe'] in ["historical", "trend"] else state['timeframe']
-                        
-                        # Fetch contract data using the tool
-                        contract_data = top_contracts_by_gas_fees_tool.invoke({
-                            "blockchain_name": category_report.blockchain,
-                            "timeframe": analysis_timeframe,
-                            "top_n": 10,  # Analyze top 10 contracts
-                            "main_category_key": category
-                        })
-                        # print(contract_data["top_contracts"])
-                        # Convert contract data to structured format
-                        contracts = []
-                        for contract_info in contract_data["top_contracts"]:
-                            contract = ContractInfo(
-                                address=contract_info["address"],
-                                project_name=contract_info.get("project_name"),
-                                name=contract_info.get("name"),
-                                gas_fees_absolute_usd=contract_info["gas_fees_absolute_usd"],
-                                main_category_key=contract_info["main_category_key"],
-                                sub_category_key=contract_info.get("sub_category_key"),
-                                chain=contract_info.get("chain"),
-                                gas_fees_absolute_eth=contract_info.get("gas_fees_absolute_eth"),
-                                txcount_absolute=contract_info.get("txcount_absolute")
-                            )
-                            contracts.append(contract)
-
-                        # Create structured report
-                        report = TopContractsByCategoryReport(
-                            blockchain=category_report.blockchain,
-                            category=category,
-                            timeframe=state['timeframe'],
-                            top_contracts=contracts,
-                            total_contracts_analyzed=contract_data["total_contracts_analyzed"],
-                            top_contract_share=contract_data["top_contract_share"],
-                            contract_concentration=contract_data["contract_concentration"],
-                            key_insights=self._generate_contract_insights(contract_data),
-                            activity_analysis=self._analyze_contract_activities(contracts)
-                        )
-
-                        contract_reports.append(report)
-                        logger.info(f"✅ {category} contract analysis completed for {category_report.blockchain}")
-
-                # Update state
-                updated_state = state.copy()
-                updated_state["contract_reports"] = contract_reports
-                updated_state["current_task"] = "contract_analysis_complete"
-
-                logger.info(f"✅ Contract analysis completed for {len(contract_reports)} category-blockchain combinations")
-                logger.info("=" * 50)
-                return updated_state
+            timeframe, analysis_timeframe, pairs = self._plan_contract_analysis(state)
+
+            started_at = time.perf_counter()
+            contract_results = await asyncio.to_thread(self._fetch_contract_results, pairs, analysis_timeframe)
+            contract_reports = self._build_contract_reports(pairs, contract_results, timeframe, analysis_timeframe)
+            return self._build_contract_state(contract_reports, started_at)
 
         except Exception as e:
-            logger.error(f"Contract analysis error: {str(e)}")
-            updated_state = state.copy()
-            updated_state["errors"].append(f"Contract Analysis: {str(e)}")
-            return updated_state
+            logger.error("Contract analysis error: %s", e)
+            return error_update(state, "Contract Analysis", e)
+
+    def _plan_contract_analysis(self, state: AnalysisState) -> Tuple[str, str, List[Tuple[str, str]]]:
+        """Resolve the timeframes and the (blockchain, category) pairs to analyze"""
+        logger.info("📄 Starting Contract Analysis")
+        logger.info("=" * 50)
+
+        # Check if we have target categories from trend analysis
+        target_categories = state.get("target_categories")
+        category_reports = state.get("category_reports")
+
+        if not category_reports and not target_categories:
+            raise ValueError("Category analysis must be completed before contract analysis")
+
+        timeframe = state['timeframe']
+        analysis_timeframe = self.analysis_timeframe(timeframe)
+
+        # If we have target categories from trend analysis, use those
+        if target_categories:
+            logger.info("🎯 Using target categories from trend analysis: %s", target_categories)
+            blockchain_names = state.get("blockchain_names", [])
+            logger.info("📊 Analyzing contracts for %d blockchains × %d categories", len(blockchain_names), len(target_categories))
+            pairs = [(blockchain, category) for blockchain in blockchain_names for category in target_categories]
+        else:
+            # Use original logic with category reports
+            logger.info("📊 Using category reports to determine top categories...")
+            pairs = []
+            for category_report in category_reports:
+                # Get top 2 categories for this blockchain
+                top_categories = get_top_categories(category_report.category_breakdown, n=2)
+                logger.info("🎯 Top categories for %s: %s", category_report.blockchain, top_categories)
+                pairs.extend((category_report.blockchain, category) for category in top_categories)
+
+        return timeframe, analysis_timeframe, pairs
+
+    def _build_contract_state(self, contract_reports: List[TopContractsByCategoryReport], started_at: float) -> Dict[str, Any]:
+        """Build the state update for finished contract reports"""
+        logger.info("✅ Contract analysis completed for %d category-blockchain combinations in %.2fs", len(contract_reports), time.perf_counter() - started_at)
+        logger.info("=" * 50)
+
+        # Return only the updated keys and let LangGraph merge them into the state
+        return {"contract_reports": contract_reports, "current_task": "contract_analysis_complete"}
+
+    @staticmethod
+    def analysis_timeframe(timeframe: str) -> str:
+        """Timeframe used for the onchain data tools for a requested timeframe"""
+        # Use "7d" timeframe for blockchain analysis even when historical growthepie analysis is requested
+        return "7d" if timeframe in {"historical", "trend"} else timeframe
+
+    @staticmethod
+    def _contract_tool_args(blockchain: str, category: str, analysis_timeframe: str) -> Dict[str, Any]:
+        """Arguments for a top contracts lookup of one (blockchain, category) pair"""
+        return {
+            "blockchain_name": blockchain,
+            "timeframe": analysis_timeframe,
+            "top_n": 10,  # Analyze top 10 contracts
+            "main_category_key": category
+        }
+
+    def _process_contract_pairs(self, pairs: List[Tuple[str, str]], timeframe: str, analysis_timeframe: str) -> List[TopContractsByCategoryReport]:
+        """Fetch and build contract reports for each (blockchain, category) pair"""
+        return self._build_contract_reports(pairs, self._fetch_contract_results(pairs, analysis_timeframe), timeframe, analysis_timeframe)
+
+    def _fetch_contract_results(self, pairs: List[Tuple[str, str]], analysis_timeframe: str) -> List[Dict[str, Any]]:
+        """Fetch contract data for every pair, in pair order, with one batched tool call"""
+        batch_result = cached_invoke(top_contracts_by_gas_fees_batch_tool, {
+            "pairs": [{"blockchain_name": blockchain, "main_category_key": category} for blockchain, category in pairs],
+            "timeframe": analysis_timeframe,
+            "top_n": 10  # Analyze top 10 contracts
+        })
+        if not batch_result.get("error"):
+            return batch_result["results"]
+
+        # Fall back to one concurrent call per (blockchain, category) pair if the batch lookup failed
+        logger.warning("⚠️ Batched contract lookup failed, falling back to per-pair calls: %s", batch_result["error"])
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(pairs)))) as executor:
+            futures = [
+                executor.submit(cached_invoke, top_contracts_by_gas_fees_tool, self._contract_tool_args(blockchain, category, analysis_timeframe))
+                for blockchain, category in pairs
+            ]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({"error": str(e)})
+        return results
+
+    def _build_contract_reports(self, pairs: List[Tuple[str, str]], contract_results: List[Dict[str, Any]],
+                                timeframe: str, analysis_timeframe: str) -> List[TopContractsByCategoryReport]:
+        """Build contract reports from the fetched data, in the same order as pairs"""
+        contract_reports = []
+        for (blockchain, category), contract_data in zip(pairs, contract_results):
+            if contract_data.get("error"):
+                error_msg = f"Error fetching contract data for {blockchain}/{category}: {contract_data['error']}"
+                logger.error("❌ %s", error_msg)
+                raise ValueError(error_msg)
+
+            contracts_found = len(contract_data.get("top_contracts", []))
+            logger.debug("📋 Found %d contracts for %s on %s (using %s timeframe)", contracts_found, category, blockchain, analysis_timeframe)
+
+            # Convert contract data to structured format
+            contracts = [ContractInfo.from_dict(contract_info) for contract_info in contract_data["top_contracts"]]
+
+            # Create structured report
+            report = TopContractsByCategoryReport(
+                blockchain=blockchain,
+                category=category,
+                timeframe=timeframe,
+                top_contracts=contracts,
+                total_contracts_analyzed=contract_data["total_contracts_analyzed"],
+                top_contract_share=contract_data["top_contract_share"],
+                contract_concentration=contract_data["contract_concentration"],
+                key_insights=self._generate_contract_insights(contract_data),
+                activity_analysis=self._analyze_contract_activities(contracts)
+            )
+
+            contract_reports.append(report)
+            logger.debug("✅ %s contract analysis completed for %s", category, blockchain)
+
+        return contract_reports
 
     def _generate_category_insights(self, category_data: Dict[str, Any]) -> List[str]:
         """Generate insights from category analysis data"""
-        insights = []
-
         breakdown = category_data["category_breakdown"]
         top_category = category_data["top_category"]
         concentration = category_data["category_concentration"]
 
-        # Market dominance insight
-        if breakdown[top_category] > 40:
-            insights.append(f"Strong {top_category.upper()} dominance with {breakdown[top_category]:.1f}% market share indicates mature ecosystem focus")
-
-        # Concentration analysis
-        if concentration > 80:
-            insights.append(f"High category concentration ({concentration:.1f}%) suggests specialized ecosystem with limited diversity")
-        elif concentration < 60:
-            insights.append(f"Balanced category distribution ({concentration:.1f}%) indicates diverse, multi-use ecosystem")
-
-        # Ecosystem maturity indicators
-        if breakdown.get("defi", 0) > 35:
-            insights.append("Strong DeFi presence indicates mature financial infrastructure")
-        if breakdown.get("nft", 0) > 25:
-            insights.append("Significant NFT activity suggests strong creator economy and digital asset adoption")
-
-        return insights
+        # Pull every share we need out of the breakdown in a single pass
+        top_share = defi_share = nft_share = 0
+        for category, share in breakdown.items():
+            if category == "defi":
+                defi_share = share
+            elif category == "nft":
+                nft_share = share
+            if category == top_category:
+                top_share = share
+
+        # Each candidate is only formatted when its threshold is met; unmet ones are filtered out
+        candidates = (
+            # Market dominance insight
+            f"Strong {top_category.upper()} dominance with {top_share:.1f}% market share indicates mature ecosystem focus" if top_share > 40 else None,
+            # Concentration analysis
+            f"High category concentration ({concentration:.1f}%) suggests specialized ecosystem with limited diversity" if concentration > 80
+            else f"Balanced category distribution ({concentration:.1f}%) indicates diverse, multi-use ecosystem" if concentration < 60
+            else None,
+            # Ecosystem maturity indicators
+            "Strong DeFi presence indicates mature financial infrastructure" if defi_share > 35 else None,
+            "Significant NFT activity suggests strong creator economy and digital asset adoption" if nft_share > 25 else None,
+        )
+        return [insight for insight in candidates if insight is not None]
 
     def _generate_contract_insights(self, contract_data: Dict[str, Any]) -> List[str]:
         """Generate insights from contract analysis data"""
@@ -339,60 +441,107 @@ After completing your analysis, respond directly to the supervisor with structur
         # Activity patterns
         contracts = contract_data["top_contracts"]
         if len(contracts) >= 3:
-            insights.append(f"Top 3 contracts represent diverse activities: {', '.join(c.get('activity', 'Unknown') for c in contracts[:3])}")
+            insights.append(f"Top 3 contracts represent diverse activities: {', '.join(c.get('activity', 'Unknown') for c in islice(contracts, 3))}")
 
         return insights
 
-    def _analyze_contract_activities(self, contracts: List[ContractInfo]) -> List[str]:
+    def _analyze_contract_activities(self, contracts: List[ContractInfo]) -> Tuple[str, ...]:
         """Analyze what activities these contracts are performing"""
-        # The activity_type field is no longer present, so this function will just return an empty list or a placeholder
-        return []
+        # The activity_type field is no longer present, so return the shared empty tuple instead of a fresh list
+        return _NO_ACTIVITIES
+
+    def _build_agent_messages(self, state: AnalysisState, current_task: str) -> List[HumanMessage]:
+        """Build the messages asking the agent which analysis to run next"""
+        return [
+            HumanMessage(content=_FALLBACK_TEMPLATE.format(
+                blockchains=", ".join(state["blockchain_names"]),
+                timeframe=state["timeframe"],
+                status=current_task
+            ))
+        ]
+
+    @staticmethod
+    def _parse_route_decision(llm_content: str) -> Optional[str]:
+        """Read the next task from a JSON decision, or None if the reply is not one"""
+        if not llm_content.lstrip().startswith("{"):
+            return None
+        try:
+            decision = json.loads(llm_content)
+        except ValueError:
+            return None
+        next_task = decision.get("next_task") if isinstance(decision, dict) else None
+        return next_task if next_task in _ROUTE_TASKS else None
+
+    def _apply_agent_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse the agent response into the next task and merge it into the state"""
+        llm_content = response["messages"][-1].content
+        # logger.info("Blockchain Revenue Agent: LLM Response: %s", llm_content)
+        next_task = self._parse_route_decision(llm_content)
+        if next_task is None:
+            # Fall back to keyword matching when the reply is free-form text
+            if _CATEGORY_RE.search(llm_content):
+                next_task = "category_analysis"
+            elif _CONTRACT_RE.search(llm_content):
+                next_task = "contract_analysis"
+            else:
+                next_task = "unknown"
+
+        return {"messages": response["messages"], "current_task": next_task}
+
+    def _route_analysis(self, state: AnalysisState, current_task: str) -> Optional[str]:
+        """Pick the analysis to run from the task name, or from the missing reports when the task is not explicit"""
+        if _CATEGORY_RE.search(current_task):
+            return "category_analysis"
+        if _CONTRACT_RE.search(current_task):
+            return "contract_analysis"
+        if not state.get("category_reports"):
+            return "category_analysis"
+        if not state.get("contract_reports"):
+            return "contract_analysis"
+        return None
+
+    @staticmethod
+    def _after_category_analysis(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Hand a completed category analysis straight on to contract analysis"""
+        if _COMPLETE_RE.search(result.get("current_task", "")):
+            result["current_task"] = "contract_analysis"
+        return result
 
     def __call__(self, state: AnalysisState) -> Dict[str, Any]:
         """Execute the appropriate analysis based on current task"""
         try:
             current_task = state.get("current_task", "")
-            logger.info(f"Blockchain Revenue Agent: Current task: {current_task}")
-            if "category" in current_task.lower():
-                result = self.execute_category_analysis(state)
-                if "complete" in result.get("current_task", "").lower():
-                    result["current_task"] = "contract_analysis"
-                return result
-            elif "contract" in current_task.lower():
-                result = self.execute_contract_analysis(state)
+            logger.info("Blockchain Revenue Agent: Current task: %s", current_task)
+            analysis = self._route_analysis(state, current_task)
+            if analysis == "category_analysis":
+                return self._after_category_analysis(self.execute_category_analysis(state))
+            elif analysis == "contract_analysis":
                 # If contract analysis is complete, just return result
-                return result
+                return self.execute_contract_analysis(state)
+            else:
+                # Both analyses are done and the task is unrecognised, so let the agent decide
+                response = self.agent.invoke({"messages": self._build_agent_messages(state, current_task)})
+                return self._apply_agent_response(response)
+
+        except Exception as e:
+            logger.error("Blockchain Revenue Agent error: %s", e)
+            return error_update(state, "Blockchain Revenue Agent", e)
+
+    async def acall(self, state: AnalysisState) -> Dict[str, Any]:
+        """Async variant of __call__ used when the workflow runs with ainvoke, so tool and LLM waits do not block the event loop"""
+        try:
+            current_task = state.get("current_task", "")
+            logger.info("Blockchain Revenue Agent: Current task: %s", current_task)
+            analysis = self._route_analysis(state, current_task)
+            if analysis == "category_analysis":
+                return self._after_category_analysis(await self.aexecute_category_analysis(state))
+            elif analysis == "contract_analysis":
+                return await self.aexecute_contract_analysis(state)
             else:
-                # Use the agent to determine what to do
-                messages = [
-                    HumanMessage(content=f"""Please analyze blockchain data:
-
-Blockchains: {', '.join(state['blockchain_names'])}
-Timeframe: {state['timeframe']}
-Current status: {current_task}
-
-Determine if you need to perform category analysis or contract analysis and execute accordingly.""")
-                ]
-
-                response = self.agent.invoke({"messages": messages})
-                updated_state = state.copy()
-                updated_state["messages"] = response["messages"]
-
-                # Parse LLM response to set next task
-                
-                llm_content = response["messages"][-1].content.lower()
-                # logger.info(f"Blockchain Revenue Agent: LLM Response: {llm_content}")
-                if "category" in llm_content:
-                    updated_state["current_task"] = "category_analysis"
-                elif "contract" in llm_content:
-                    updated_state["current_task"] = "contract_analysis"
-                else:
-                    updated_state["current_task"] = "unknown"
-
-                return updated_state
+                # Both analyses are done and the task is unrecognised, so let the agent decide
+                response = await self.agent.ainvoke({"messages": self._build_agent_messages(state, current_task)})
+                return self._apply_agent_response(response)
 
         except Exception as e:
-            logger.error(f"Blockchain Revenue Agent error: {str(e)}")
-            updated_state = state.copy()
-            updated_state["errors"].append(f"Blockchain Revenue Agent: {str(e)}")
-            return updated_state
\ No newline at end of file
+            logger.error("Blockchain Revenue Agent error: %s", e)
+            return error_update(state, "Blockchain Revenue Agent", e)
@@ -5,39 +5,18 @@ Performs 3-step analysis: get datasets → analyze each → combine results.
 
 from typing import Dict, Any, List
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
-from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
+from ..utils.agent_utils import error_update
+from ..utils.llm_utils import get_chat_model
 from ..schemas.state import AnalysisState
-from ..tools.blockchain_tools import get_latest_growthepie_datasets_tool, get_data_overview, get_combined_analysis
+from ..tools.blockchain_tools import get_latest_growthepie_datasets_tool, get_data_overview, get_combined_analysis, GROWTHEPIE_CACHE_DIR
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
-
-class TrendAnalysisAgent:
-    """
-    Specialized agent for analyzing historical blockchain datasets from GrowthePie cache.
-    Performs chronological analysis of cached datasets to identify trends and patterns.
-    """
-
-    def __init__(self, model_name: str = "gpt-4"):
-        self.model = ChatOpenAI(model=model_name, temperature=0.1)
-        self.name = "trend_analysis_agent"
-
-        # Tools available to this agent
-        self.tools = [get_latest_growthepie_datasets_tool, get_data_overview, get_combined_analysis]
-
-        # Create the agent using LangGraph's prebuilt function
-        self.agent = create_react_agent(
-            model=self.model,
-            tools=self.tools,
-            prompt=self._get_system_prompt(),
-            name=self.name
-        )
-
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt for the trend analysis agent"""
-        return """You are a Senior Blockchain Data Analyst specializing in historical dataset analysis using GrowthePie cached data.
+_SYSTEM_PROMPT = """You are a Senior Blockchain Data Analyst specializing in historical dataset analysis using GrowthePie cached data.
 
 EXPERTISE:
 - Deep knowledge of blockchain ecosystems and historical data patterns
@@ -66,7 +45,41 @@ OUTPUT REQUIREMENTS:
 
 After completing your analysis, respond directly to the supervisor with structured findings."""
 
-    def execute_trend_analysis(self, state: AnalysisState) -> AnalysisState:
+_TOOLS = (get_latest_growthepie_datasets_tool, get_data_overview, get_combined_analysis)
+
+
+@lru_cache(maxsize=8)
+def _build_react_agent(model_name: str):
+    """Build the react agent once per model and reuse it across instances"""
+    return create_react_agent(
+        model=get_chat_model(model_name),
+        tools=list(_TOOLS),
+        prompt=_SYSTEM_PROMPT,
+        name="trend_analysis_agent"
+    )
+
+
+class TrendAnalysisAgent:
+    """
+    Specialized agent for analyzing historical blockchain datasets from GrowthePie cache.
+    Performs chronological analysis of cached datasets to identify trends and patterns.
+    """
+
+    def __init__(self, model_name: str = "gpt-4"):
+        self.model = get_chat_model(model_name)
+        self.name = "trend_analysis_agent"
+
+        # Tools available to this agent
+        self.tools = list(_TOOLS)
+
+        # Reuse the agent built by LangGraph's prebuilt function for this model
+        self.agent = _build_react_agent(model_name)
+
+    def _get_system_prompt(self) -> str:
+        """Get the system prompt for the trend analysis agent"""
+        return _SYSTEM_PROMPT
+
+    def execute_trend_analysis(self, state: AnalysisState) -> Dict[str, Any]:
         """Execute the complete 3-step trend analysis workflow"""
         try:
             logger.info("📊 Starting Trend Analysis Agent")
@@ -79,9 +92,7 @@ After completing your analysis, respond directly to the supervisor with structur
             if not datasets_result.get('success'):
                 error_msg = f"Failed to get datasets: {datasets_result.get('error')}"
                 logger.error(f"❌ {error_msg}")
-                updated_state = state.copy()
-                updated_state["errors"].append(f"Trend Analysis: {error_msg}")
-                return updated_state
+                return error_update(state, "Trend Analysis", error_msg)
 
             datasets_loaded = datasets_result.get('datasets_loaded', 0)
             dataset_names = datasets_result.get('dataset_names', [])
@@ -92,40 +103,44 @@ After completing your analysis, respond directly to the supervisor with structur
             logger.info(f"⏰ Chronological order: {chronological_order}")
             
             # Step 2: Analyze each dataframe individually
-            dataframes = datasets_result.get('dataframes', [])
+            # Only the per-dataset metadata is needed here; the tool builds one info entry per loaded dataframe
             dataframe_info = datasets_result.get('dataframe_info', [])
             individual_analyses = []
             individual_dataset_info = []
             
-            logger.info(f"📊 Step 2: Analyzing {len(dataframes)} dataframes individually...")
+            logger.info(f"📊 Step 2: Analyzing {len(dataframe_info)} dataframes individually...")
             
-            for i, (df, info) in enumerate(zip(dataframes, dataframe_info), 1):
-                dataset_order = info.get('order', 'unknown')
-                filename = info.get('filename', f'dataset_{i}.csv')
-                rows = info.get('rows', 0)
-                
-                logger.info(f"🔍 Step 2.{i}: Analyzing dataframe {i} ({dataset_order} dataset)")
-                logger.info(f"   📁 File: {filename}")
-                logger.info(f"   📊 Rows: {rows}")
-                
-                # Create file path for the dataframe
-                file_path = f"src/data/growthepie_cache/{filename}"
-                
-                analysis_result = get_data_overview.invoke({
-                    "file_path": file_path,
-                    "dataset_info": info
-                })
-                
+            # The individual analyses are independent LLM/pandas calls, so run them concurrently
+            # and only wait on both before the combine step, which is the one true dependency
+            with ThreadPoolExecutor(max_workers=max(1, len(dataframe_info))) as executor:
+                futures = []
+                for i, info in enumerate(dataframe_info, 1):
+                    dataset_order = info.get('order', 'unknown')
+                    filename = info.get('filename', f'dataset_{i}.csv')
+                    rows = info.get('rows', 0)
+
+                    logger.info("🔍 Step 2.%d: Analyzing dataframe %d (%s dataset)", i, i, dataset_order)
+                    logger.info("   📁 File: %s", filename)
+                    logger.info("   📊 Rows: %s", rows)
+
+                    # Create file path for the dataframe
+                    file_path = str(GROWTHEPIE_CACHE_DIR / filename)
+
+                    futures.append(executor.submit(get_data_overview.invoke, {
+                        "file_path": file_path,
+                        "dataset_info": info
+                    }))
+
+            for i, future in enumerate(futures, 1):
+                analysis_result = future.result()
                 if analysis_result.get('success'):
-                    logger.info(f"✅ Analysis {i} completed successfully!")
+                    logger.info("✅ Analysis %d completed successfully!", i)
                     individual_analyses.append(analysis_result.get('analysis_result'))
                     individual_dataset_info.append(analysis_result.get('dataset_info'))
                 else:
                     error_msg = f"Error in analysis {i}: {analysis_result.get('error')}"
                     logger.error(f"❌ {error_msg}")
-                    updated_state = state.copy()
-                    updated_state["errors"].append(f"Trend Analysis: {error_msg}")
-                    return updated_state
+                    return error_update(state, "Trend Analysis", error_msg)
 
             # Step 3: Combine analyses with chronological context
             logger.info(f"🔗 Step 3: Combining {len(individual_analyses)} analyses...")
@@ -142,36 +157,29 @@ After completing your analysis, respond directly to the supervisor with structur
                     logger.info("✅ Combined analysis completed successfully!")
                     logger.info("=" * 50)
                     
-                    # Update state with results
-                    updated_state = state.copy()
-                    updated_state["growthepie_analysis"] = {
-                        "individual_analyses": individual_analyses,
-                        "combined_analysis": combined_result.get('combined_analysis'),
-                        "dataset_info": individual_dataset_info,
-                        "chronological_order": datasets_result.get('chronological_order'),
-                        "success": True
+                    # Return only the updated keys and let LangGraph merge them into the state
+                    return {
+                        "growthepie_analysis": {
+                            "individual_analyses": individual_analyses,
+                            "combined_analysis": combined_result.get('combined_analysis'),
+                            "dataset_info": individual_dataset_info,
+                            "chronological_order": datasets_result.get('chronological_order'),
+                            "success": True
+                        },
+                        "current_task": "trend_analysis_complete"
                     }
-                    updated_state["current_task"] = "trend_analysis_complete"
-                    
-                    return updated_state
                 else:
                     error_msg = f"Error in combined analysis: {combined_result.get('error')}"
                     logger.error(f"❌ {error_msg}")
-                    updated_state = state.copy()
-                    updated_state["errors"].append(f"Trend Analysis: {error_msg}")
-                    return updated_state
+                    return error_update(state, "Trend Analysis", error_msg)
             else:
                 error_msg = f"Expected 2 analyses, got {len(individual_analyses)}"
                 logger.error(f"❌ {error_msg}")
-                updated_state = state.copy()
-                updated_state["errors"].append(f"Trend Analysis: {error_msg}")
-                return updated_state
+                return error_update(state, "Trend Analysis", error_msg)
 
         except Exception as e:
             logger.error(f"Trend Analysis error: {str(e)}")
-            updated_state = state.copy()
-            updated_state["errors"].append(f"Trend Analysis: {str(e)}")
-            return updated_state
+            return error_update(state, "Trend Analysis", e)
 
     def __call__(self, state: AnalysisState) -> Dict[str, Any]:
         """Execute the trend analysis workflow"""
@@ -182,6 +190,4 @@ After completing your analysis, respond directly to the supervisor with structur
             return result
         except Exception as e:
             logger.error(f"Trend Analysis Agent error: {str(e)}")
-            updated_state = state.copy()
-            updated_state["errors"].append(f"Trend Analysis Agent: {str(e)}")
-            return updated_state 
\ No newline at end of file
+            return error_update(state, "Trend Analysis Agent", e)
\ No newline at end of file
@@ -3,51 +3,28 @@ Project Manager Agent - Coordinates the multi-agent workflow for blockchain anal
 Acts as the supervisor agent that delegates tasks to specialized agents.
 """
 
-from typing import Dict, Any, List
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional, Tuple
+from langchain_core.messages import HumanMessage
 from langgraph.prebuilt import create_react_agent
+from ..utils.llm_utils import get_chat_model
 from ..schemas.state import AnalysisState
-from ..utils.agent_utils import create_handoff_tool, create_system_message
+from ..utils.agent_utils import create_handoff_tool, error_update
+from ..tools.blockchain_tools import ToolResultCache
+from functools import lru_cache
+import hashlib
+import json
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Trend-analysis LLM responses keyed by a hash of (model, prompt, temperature); only used for opted-in runs of a deterministic (temperature 0) model
+_trend_response_cache = ToolResultCache(maxsize=64, ttl=3600.0)
 
-class ProjectManagerAgent:
-    """
-    Senior Project Manager specializing in blockchain analytics projects.
-    Orchestrates workflow, manages crew progress, validates outputs.
-    """
-
-    def __init__(self, model_name: str = "gpt-4"):
-        self.model = ChatOpenAI(model=model_name, temperature=0.1)
-        self.name = "project_manager"
-
-        # Create handoff tools for task delegation
-        self.assign_to_revenue_agent = create_handoff_tool(
-            agent_name="blockchain_revenue_agent",
-            description="Assign blockchain revenue analysis tasks to the specialized agent."
-        )
-
-        self.assign_to_strategic_agent = create_handoff_tool(
-            agent_name="strategic_editor_agent", 
-            description="Assign strategic synthesis tasks to the strategic editor."
-        )
-
-        self.tools = [self.assign_to_revenue_agent, self.assign_to_strategic_agent]
+# Category names picked out of a trend-analysis response that is not valid JSON
+_CATEGORY_RE = re.compile(r"\b(defi|social|nft|cefi)\b", re.IGNORECASE)
 
-        # Create the agent using LangGraph's prebuilt function
-        self.agent = create_react_agent(
-            model=self.model,
-            tools=self.tools,
-            prompt=self._get_system_prompt(),
-            name=self.name
-        )
-
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt for the project manager agent"""
-        return """You are a Senior Project Manager specializing in blockchain analytics projects.
+_SYSTEM_PROMPT = """You are a Senior Project Manager specializing in blockchain analytics projects.
 
 RESPONSIBILITIES:
 - Orchestrate the complete workflow for blockchain revenue analysis
@@ -75,20 +52,105 @@ You manage agents with different specializations:
 
 Be systematic, thorough, and ensure all deliverables meet high standards."""
 
-    def analyze_trend_results(self, trend_analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze trend results to identify categories with significant changes"""
-        try:
-            logger.info("🧠 Project Manager: Analyzing trend results for significant changes")
-            logger.info("=" * 50)
-            
-            combined_analysis = trend_analysis.get("combined_analysis", "")
-            chronological_order = trend_analysis.get("chronological_order", [])
-            
-            logger.info(f"📊 Analyzing combined analysis for trends...")
-            logger.info(f"⏰ Chronological order: {chronological_order}")
-            
-            # Use LLM to analyze the combined analysis and identify significant categories
-            analysis_prompt = f"""Analyze this historical blockchain data analysis and identify categories with significant changes:
+
+@lru_cache(maxsize=1)
+def _get_handoff_tools() -> Tuple[Any, Any]:
+    """Create the handoff tools used for task delegation"""
+    assign_to_revenue_agent = create_handoff_tool(
+        agent_name="blockchain_revenue_agent",
+        description="Assign blockchain revenue analysis tasks to the specialized agent."
+    )
+    assign_to_strategic_agent = create_handoff_tool(
+        agent_name="strategic_editor_agent",
+        description="Assign strategic synthesis tasks to the strategic editor."
+    )
+    return assign_to_revenue_agent, assign_to_strategic_agent
+
+
+@lru_cache(maxsize=8)
+def _build_react_agent(model_name: str):
+    """Build the react agent once per model and reuse it across instances"""
+    return create_react_agent(
+        model=get_chat_model(model_name),
+        tools=list(_get_handoff_tools()),
+        prompt=_SYSTEM_PROMPT,
+        name="project_manager"
+    )
+
+
+class ProjectManagerAgent:
+    """
+    Senior Project Manager specializing in blockchain analytics projects.
+    Orchestrates workflow, manages crew progress, validates outputs.
+    """
+
+    def __init__(self, model_name: str = "gpt-4", temperature: float = 0.1):
+        self.model = get_chat_model(model_name, temperature=temperature)
+        self.model_name = model_name
+        self.name = "project_manager"
+
+        # Handoff tools for task delegation are shared across instances
+        self.assign_to_revenue_agent, self.assign_to_strategic_agent = _get_handoff_tools()
+
+        self.tools = [self.assign_to_revenue_agent, self.assign_to_strategic_agent]
+
+        # Reuse the agent built by LangGraph's prebuilt function for this model
+        self.agent = _build_react_agent(model_name)
+
+    def _get_system_prompt(self) -> str:
+        """Get the system prompt for the project manager agent"""
+        return _SYSTEM_PROMPT
+
+    def _trend_cache_key(self, prompt: str) -> Tuple[str, str]:
+        """Key the trend-analysis response cache on (model, prompt, temperature)"""
+        return ("trend_analysis", hashlib.sha256(json.dumps(
+            {"model": self.model_name, "prompt": prompt, "temp": self.model.temperature}, sort_keys=True, separators=(",", ":")
+        ).encode()).hexdigest())
+
+    def _lookup_trend_response(self, prompt: str, use_cache: bool) -> Tuple[Optional[Tuple[str, str]], Optional[str]]:
+        """Cache key and cached response for a trend prompt; the key is None when the response must not be cached"""
+        # Sampled responses differ run to run, so they are never replayed from the cache
+        if not use_cache or self.model.temperature > 0:
+            return None, None
+
+        key = self._trend_cache_key(prompt)
+        cached = _trend_response_cache.get(key)
+        if cached is not None:
+            logger.info("♻️ Project Manager: Reusing cached trend analysis response")
+            return key, cached["content"]
+        return key, None
+
+    def _invoke_trend_model(self, prompt: str, use_cache: bool = False) -> str:
+        """Invoke the model for trend analysis, reusing the response to an identical recent prompt when use_cache is set"""
+        key, content = self._lookup_trend_response(prompt, use_cache)
+        if content is None:
+            content = self.model.invoke(prompt).content
+            if key is not None:
+                _trend_response_cache.set(key, {"content": content})
+        return content
+
+    async def _ainvoke_trend_model(self, prompt: str, use_cache: bool = False) -> str:
+        """Async variant of _invoke_trend_model"""
+        key, content = self._lookup_trend_response(prompt, use_cache)
+        if content is None:
+            content = (await self.model.ainvoke(prompt)).content
+            if key is not None:
+                _trend_response_cache.set(key, {"content": content})
+        return content
+
+    def _build_trend_prompt(self, trend_analysis: Dict[str, Any]) -> Tuple[str, str, List[Dict[str, Any]]]:
+        """Build the trend-analysis prompt, returning it with the combined analysis and chronological order"""
+        logger.info("🧠 Project Manager: Analyzing trend results for significant changes")
+        logger.info("=" * 50)
+        
+        combined_analysis = trend_analysis.get("combined_analysis", "")
+        chronological_order = trend_analysis.get("chronological_order", [])
+        
+        logger.info("📊 Analyzing combined analysis for trends...")
+        logger.info("⏰ Chronological order: %s", chronological_order)
+        
+        # Use LLM to analyze the combined analysis and identify significant categories
+        analysis_prompt = f"""Analyze this historical blockchain data analysis and identify categories with significant changes:
 
 Chronological Order: {chronological_order}
 Combined Analysis: {combined_analysis}
@@ -100,100 +162,169 @@ Identify categories that show:
 Return ONLY a JSON list of category names (e.g., ["defi", "social"]) that show significant changes and warrant contract analysis.
 Focus on categories that have meaningful trends, not just noise."""
 
-            response = self.model.invoke(analysis_prompt)
-            
-            # Parse the response to extract category names
-            try:
-                import json
-                target_categories = json.loads(response.content.strip())
-                if not isinstance(target_categories, list):
-                    target_categories = ["defi"]  # Default fallback
-            except:
-                # Fallback parsing if JSON fails
-                content = response.content.lower()
-                target_categories = []
-                if "defi" in content:
-                    target_categories.append("defi")
-                if "social" in content:
-                    target_categories.append("social")
-                if "nft" in content:
-                    target_categories.append("nft")
-                if "cefi" in content:
-                    target_categories.append("cefi")
-                if not target_categories:
-                    target_categories = ["defi"]  # Default fallback
-
-            insights = {
-                "target_categories": target_categories,
-                "analysis_reasoning": response.content,
-                "chronological_order": chronological_order,
-                "combined_analysis": combined_analysis
-            }
-
-            logger.info(f"🎯 Identified target categories: {target_categories}")
-            logger.info(f"📝 Analysis reasoning: {response.content[:200]}...")
-            logger.info("=" * 50)
-            return insights
+        return analysis_prompt, combined_analysis, chronological_order
+
+    def _build_trend_insights(self, response_content: str, combined_analysis: str, chronological_order: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Parse the trend-analysis response into insights"""
+        # Parse the response to extract category names
+        try:
+            target_categories = json.loads(response_content.strip())
+            if not isinstance(target_categories, list):
+                target_categories = ["defi"]  # Default fallback
+        except ValueError:
+            # Fallback parsing if JSON fails: one regex pass, keeping first-mention order
+            target_categories = list(dict.fromkeys(match.lower() for match in _CATEGORY_RE.findall(response_content)))
+            if not target_categories:
+                target_categories = ["defi"]  # Default fallback
+
+        insights = {
+            "target_categories": target_categories,
+            "analysis_reasoning": response_content,
+            "chronological_order": chronological_order,
+            "combined_analysis": combined_analysis
+        }
+
+        logger.info("🎯 Identified target categories: %s", target_categories)
+        logger.info("📝 Analysis reasoning: %.200s...", response_content)
+        logger.info("=" * 50)
+        return insights
+
+    def _trend_error_insights(self, error: Exception) -> Dict[str, Any]:
+        """Fallback insights when trend analysis fails"""
+        logger.error("Project Manager: Error analyzing trend results: %s", error)
+        return {
+            "target_categories": ["defi"],  # Default fallback
+            "analysis_reasoning": f"Error in analysis: {str(error)}",
+            "chronological_order": [],
+            "combined_analysis": ""
+        }
+
+    def analyze_trend_results(self, trend_analysis: Dict[str, Any], use_cache: bool = False) -> Dict[str, Any]:
+        """Analyze trend results to identify categories with significant changes"""
+        try:
+            analysis_prompt, combined_analysis, chronological_order = self._build_trend_prompt(trend_analysis)
+            response_content = self._invoke_trend_model(analysis_prompt, use_cache)
+            return self._build_trend_insights(response_content, combined_analysis, chronological_order)
+
+        except Exception as e:
+            return self._trend_error_insights(e)
+
+    async def aanalyze_trend_results(self, trend_analysis: Dict[str, Any], use_cache: bool = False) -> Dict[str, Any]:
+        """Async variant of analyze_trend_results that awaits the model instead of blocking the event loop"""
+        try:
+            analysis_prompt, combined_analysis, chronological_order = self._build_trend_prompt(trend_analysis)
+            response_content = await self._ainvoke_trend_model(analysis_prompt, use_cache)
+            return self._build_trend_insights(response_content, combined_analysis, chronological_order)
 
         except Exception as e:
-            logger.error(f"Project Manager: Error analyzing trend results: {str(e)}")
-            return {
-                "target_categories": ["defi"],  # Default fallback
-                "analysis_reasoning": f"Error in analysis: {str(e)}",
-                "chronological_order": [],
-                "combined_analysis": ""
-            }
+            return self._trend_error_insights(e)
+
+    def _plan_next_task(self, state: AnalysisState) -> Optional[str]:
+        """Pick the next task from the completed reports, or None when the state is ambiguous"""
+        if not state.get("category_reports"):
+            return "category_analysis"
+        if not state.get("contract_reports"):
+            return "contract_analysis"
+        if not state.get("strategic_synthesis"):
+            return "strategic_synthesis"
+        return None
+
+    def _needs_trend_insights(self, state: AnalysisState) -> bool:
+        """Whether trend results are waiting to be analyzed"""
+        return bool(state.get("growthepie_analysis")) and not state.get("growthepie_insights")
+
+    def _trend_update(self, state: AnalysisState, trend_insights: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the state update after analyzing trend results"""
+        logger.info("Project Manager: Trend analysis completed, ready for targeted contract analysis")
+        # The next task is planned from the state in the same step, so interpreting the trend results costs one LLM call and no delegation call
+        return {
+            "growthepie_insights": trend_insights,
+            "target_categories": trend_insights["target_categories"],
+            "current_task": self._plan_next_task(state) or "trend_analysis_analyzed"
+        }
+
+    def _coordination_messages(self, state: AnalysisState, current_task: str) -> List[HumanMessage]:
+        """Prepare input for the coordinating agent"""
+        return [
+            HumanMessage(content=f"""Please coordinate the blockchain analysis workflow:
+
+Blockchains to analyze: {', '.join(state['blockchain_names'])}
+Timeframe: {state['timeframe']}
+Current task: {current_task}
+
+Please delegate the appropriate tasks to the specialized agents following the workflow order.""")
+        ]
+
+    def _coordination_update(self, current_task: str, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the state update from the coordinating agent's response"""
+        # Return only the updated keys and let LangGraph merge them into the state
+        update = {"messages": response["messages"]}
+
+        # Only set to 'delegating' if current_task is not already a specific analysis task
+        if current_task == "delegating":
+            # Already delegating, don't overwrite
+            pass
+        elif "analysis" in current_task or "synthesis" in current_task:
+            # Already in a specific task, don't overwrite
+            pass
+        else:
+            update["current_task"] = "delegating"
+
+        logger.info("Project Manager: Workflow coordination initiated")
+        return update
+
+    def _delegate_from_state(self, state: AnalysisState) -> Optional[Dict[str, Any]]:
+        """Delegate straight from the state when the next step is known, since the workflow order is fixed"""
+        next_task = self._plan_next_task(state)
+        if next_task:
+            logger.info("Project Manager: Delegating %s without an LLM call", next_task)
+            return {"current_task": next_task}
+        return None
 
     def __call__(self, state: AnalysisState) -> Dict[str, Any]:
         """Execute the project manager logic"""
         try:
             logger.info("Project Manager: Starting workflow coordination")
 
-                        # Check if we need to analyze trend results
-            if state.get("growthepie_analysis") and not state.get("growthepie_insights"):
+            # Check if we need to analyze trend results
+            if self._needs_trend_insights(state):
                 logger.info("Project Manager: Analyzing trend results for target categories")
-                trend_insights = self.analyze_trend_results(state["growthepie_analysis"])
-                
-                updated_state = state.copy()
-                updated_state["growthepie_insights"] = trend_insights
-                updated_state["target_categories"] = trend_insights["target_categories"]
-                updated_state["current_task"] = "trend_analysis_analyzed"
-                
-                logger.info("Project Manager: Trend analysis completed, ready for targeted contract analysis")
-                return updated_state
-
-            # Prepare input for the agent
-            messages = [
-                HumanMessage(content=f"""Please coordinate the blockchain analysis workflow:
+                return self._trend_update(state, self.analyze_trend_results(state["growthepie_analysis"], state.get("use_cache", False)))
 
-Blockchains to analyze: {', '.join(state['blockchain_names'])}
-Timeframe: {state['timeframe']}
-Current task: {state.get('current_task', 'initial')}
+            update = self._delegate_from_state(state)
+            if update:
+                return update
+
+            current_task = state.get("current_task", "initial")
+
+            # Execute the agent
+            response = self.agent.invoke({"messages": self._coordination_messages(state, current_task)})
+            return self._coordination_update(current_task, response)
+
+        except Exception as e:
+            logger.error("Project Manager error: %s", e)
+            return error_update(state, "Project Manager", e)
+
+    async def acall(self, state: AnalysisState) -> Dict[str, Any]:
+        """Async variant of __call__ used when the workflow runs with ainvoke"""
+        try:
+            logger.info("Project Manager: Starting workflow coordination")
+
+            # Check if we need to analyze trend results
+            if self._needs_trend_insights(state):
+                logger.info("Project Manager: Analyzing trend results for target categories")
+                return self._trend_update(state, await self.aanalyze_trend_results(state["growthepie_analysis"], state.get("use_cache", False)))
+
+            update = self._delegate_from_state(state)
+            if update:
+                return update
+
+            current_task = state.get("current_task", "initial")
 
-Please delegate the appropriate tasks to the specialized agents following the workflow order.""")
-            ]
-           
             # Execute the agent
-            response = self.agent.invoke({"messages": messages})
-            # Update state
-            updated_state = state.copy()
-            updated_state["messages"] = response["messages"]
-
-            # Only set to 'delegating' if current_task is not already a specific analysis task
-            if state.get("current_task", "initial") == "delegating":
-                # Already delegating, don't overwrite
-                pass
-            elif "analysis" in state.get("current_task", "") or "synthesis" in state.get("current_task", ""):
-                # Already in a specific task, don't overwrite
-                pass
-            else:
-                updated_state["current_task"] = "delegating"
-
-            logger.info("Project Manager: Workflow coordination initiated")
-            return updated_state
+            response = await self.agent.ainvoke({"messages": self._coordination_messages(state, current_task)})
+            return self._coordination_update(current_task, response)
 
         except Exception as e:
-            logger.error(f"Project Manager error: {str(e)}")
-            updated_state = state.copy()
-            updated_state["errors"].append(f"Project Manager: {str(e)}")
-            return updated_state
\ No newline at end of file
+            logger.error("Project Manager error: %s", e)
+            return error_update(state, "Project Manager", e)
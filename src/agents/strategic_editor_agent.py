@@ -3,40 +3,31 @@ Strategic Editor Agent - Chief Strategy Officer specializing in blockchain compe
 Synthesizes technical analysis into strategic insights and recommendations.
 """
 
-from typing import Dict, Any, List
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional, Tuple
+from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.prebuilt import create_react_agent
+from pydantic import BaseModel
 from ..schemas.state import AnalysisState, StrategicSynthesisReport
+from ..utils.agent_utils import error_update
+from ..utils.llm_utils import get_chat_model
+from ..tools.blockchain_tools import ToolResultCache
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from heapq import nlargest
+from operator import attrgetter, itemgetter
+from pathlib import Path
+import copy
+import hashlib
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Synthesis agent responses keyed by a hash of the model and prompt, used only when the run opts in with "cache"
+_synthesis_response_cache = ToolResultCache(maxsize=32, ttl=3600.0)
 
-class StrategicEditorAgent:
-    """
-    Chief Strategy Officer specializing in blockchain competitive intelligence.
-    Synthesizes analysis reports into strategic insights and recommendations.
-    """
-
-    def __init__(self, model_name: str = "gpt-4.1"):
-        self.model = ChatOpenAI(model="gpt-4.1", temperature=0.1)
-        self.name = "strategic_editor_agent"
-
-        # No tools needed - this agent only synthesizes existing data
-        self.tools = []
-
-        # Create the agent using LangGraph's prebuilt function
-        self.agent = create_react_agent(
-            model=self.model,
-            tools=self.tools,
-            prompt=self._get_system_prompt(),
-            name=self.name
-        )
-
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt for the strategic editor agent"""
-        return """You are a Chief Strategy Officer specializing in blockchain competitive intelligence and strategic analysis.
+_SYSTEM_PROMPT = """You are a Chief Strategy Officer specializing in blockchain competitive intelligence and strategic analysis.
 
 EXPERTISE:
 - Competitive landscape analysis in blockchain ecosystems
@@ -75,98 +66,253 @@ OUTPUT REQUIREMENTS:
 
 You do not perform any technical analysis yourself - you synthesize existing reports into strategic insights."""
 
-    def execute_strategic_synthesis(self, state: AnalysisState) -> AnalysisState:
+
+# Timeframes that are analyzed from growthepie history rather than live category data
+_TREND_TIMEFRAMES = frozenset({"historical", "trend"})
+
+# Greedy decoding with a fixed seed keeps the synthesis reproducible for identical reports, so cached responses stay valid
+_SYNTHESIS_SEED = 42
+
+
+@lru_cache(maxsize=8)
+def _build_react_agent(model_name: str, temperature: float = 0):
+    """Build the react agent once per model and reuse it across instances"""
+    return create_react_agent(
+        model=get_chat_model(model_name, temperature=temperature, seed=_SYNTHESIS_SEED),
+        tools=[],
+        prompt=_SYSTEM_PROMPT,
+        name="strategic_editor_agent"
+    )
+
+
+_REPORTS_SCHEMA_PATH = Path(__file__).resolve().parent.parent / "schemas" / "reports.yaml"
+
+
+@lru_cache(maxsize=1)
+def _load_reports_schema() -> str:
+    """Read the reports schema from the schemas folder once per process"""
+    return _REPORTS_SCHEMA_PATH.read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=1)
+def _get_synthesis_system_prompt() -> str:
+    """System prompt with reports.yaml from the schemas folder appended, composed once per process"""
+    return f"{_SYSTEM_PROMPT}\n\nReports schema: {_load_reports_schema()}"
+
+
+def _to_compact_json(value: Any) -> str:
+    """Serialize reports for the prompt as compact JSON rather than verbose model reprs"""
+    if isinstance(value, list):
+        value = [item.model_dump(mode="json") if isinstance(item, BaseModel) else item for item in value]
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+# Categories that are never recommended as underserved opportunities
+_EXCLUDED_CATEGORIES = frozenset({"unlabeled", "token_transfers"})
+
+# Risk-return profile text for BlockchainCategoriesReport.risk_profile
+_RISK_PROFILE_LABELS = {
+    "concentrated": "High concentration, specialized ecosystem",
+    "diversified": "Diversified, balanced ecosystem",
+    "moderate": "Moderate concentration, emerging specialization",
+}
+
+# Closing block of the risk assessment, identical for every run
+_MITIGATION_STRATEGIES = (
+    "\nMitigation strategies:\n"
+    "- Diversify across multiple blockchains and categories\n"
+    "- Monitor protocol concentration trends for early warning signals\n"
+    "- Maintain exposure to emerging protocols to capture growth opportunities\n"
+)
+
+
+def _concentration_bucket(contract_concentration: float) -> str:
+    """Bucket a contract report's concentration ratio for the protocol concentration tally"""
+    if contract_concentration > 75:
+        return "high"
+    if contract_concentration <= 60:
+        return "balanced"
+    return "moderate"
+
+
+@dataclass
+class SynthesisCache:
+    """Aggregates over the analysis reports shared by the synthesis helpers, built once by _precompute"""
+    category_reports: List[Any]
+    contract_reports: List[Any]
+    # category -> [sum of shares, number of chains, max share]
+    category_aggregates: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(lambda: [0.0, 0, float("-inf")]))
+    sorted_by_fees: List[Any] = field(default_factory=list)
+    max_by_fees: Optional[Any] = None
+    min_by_concentration: Optional[Any] = None
+    top_category: Optional[str] = None
+    high_risk_chains: List[Any] = field(default_factory=list)
+    diverse_chains: List[str] = field(default_factory=list)
+    defi_leaders: List[str] = field(default_factory=list)
+    # (blockchain, category, share) of the smallest underserved category share
+    top_opportunity: Optional[Tuple[str, str, float]] = None
+
+
+class StrategicEditorAgent:
+    """
+    Chief Strategy Officer specializing in blockchain competitive intelligence.
+    Synthesizes analysis reports into strategic insights and recommendations.
+    """
+
+    def __init__(self, model_name: str = "gpt-4.1", temperature: float = 0):
+        self.model = get_chat_model(model_name, temperature=temperature, seed=_SYNTHESIS_SEED)
+        self.name = "strategic_editor_agent"
+
+        # No tools needed - this agent only synthesizes existing data
+        self.tools = []
+
+        # Reuse the agent built by LangGraph's prebuilt function for this model
+        self.agent = _build_react_agent(model_name, temperature)
+
+    def _get_system_prompt(self) -> str:
+        """Get the system prompt for the strategic editor agent"""
+        return _SYSTEM_PROMPT
+
+    def _prepare_synthesis(self, state: AnalysisState) -> List[Any]:
+        """Validate the state and build the messages for the synthesis call"""
+        category_reports = state.get("category_reports", [])
+        contract_reports = state.get("contract_reports", [])
+        growthepie_analysis = state.get("growthepie_analysis")
+        is_trend_analysis = state.get("timeframe") in _TREND_TIMEFRAMES
+
+        # For historical/trend analysis, we need trend analysis
+        if is_trend_analysis and not growthepie_analysis:
+            raise ValueError("Trend analysis must be completed for historical/trend analysis")
+
+        # For regular analysis, we need category and contract reports
+        if not is_trend_analysis and (not category_reports or not contract_reports):
+            raise ValueError("Both category and contract analysis must be completed before strategic synthesis")
+
+        # Parse the reports into a single message with one section per report type; trend runs always include the growthepie history
+        sections = [
+            f"## Category Reports\n{_to_compact_json(category_reports)}",
+            f"## Contract Reports\n{_to_compact_json(contract_reports)}"
+        ]
+        if is_trend_analysis:
+            sections.append(f"## Growthepie Historical Analysis\n{_to_compact_json(growthepie_analysis)}")
+        if category_reports:
+            # Deterministic aggregates for the model to build on; generated_at is left out so identical reports give identical prompts
+            baseline = self.build_synthesis_report(category_reports, contract_reports).model_dump(exclude={"generated_at"})
+            sections.append(f"## Rule-Based Baseline\n{_to_compact_json(baseline)}")
+
+        return [
+            SystemMessage(content=_get_synthesis_system_prompt()),
+            HumanMessage(content="\n\n".join(sections))
+        ]
+
+    def _apply_synthesis_response(self, state: AnalysisState, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the state update from the synthesis agent's response"""
+        llm_content = response["messages"][-1].content
+
+        # Return only the updated keys and let LangGraph merge them into the state
+        update = {
+            "messages": response["messages"],
+            "strategic_synthesis": llm_content,
+            "current_task": "synthesis_complete"
+        }
+
+        logger.info("Strategic synthesis completed successfully")
+        logger.info("Strategic synthesis: %s", llm_content)
+        return update
+
+    def _synthesis_cache_key(self, messages: List[Any]) -> Tuple[str, str]:
+        """Key the synthesis response cache on the model and the full prompt content"""
+        payload = json.dumps([self.model.model_name, *(message.content for message in messages)], separators=(",", ":"), ensure_ascii=False)
+        return ("strategic_synthesis", hashlib.blake2b(payload.encode(), digest_size=16).hexdigest())
+
+    def execute_strategic_synthesis(self, state: AnalysisState) -> Dict[str, Any]:
         """Execute strategic synthesis of category and contract analysis reports"""
         try:
             logger.info("Executing strategic synthesis of analysis reports")
-
-            # Check for required analyses
-            has_category_reports = bool(state.get("category_reports"))
-            has_contract_reports = bool(state.get("contract_reports"))
-            has_growthepie_analysis = bool(state.get("growthepie_analysis"))
-
-                        # For historical/trend analysis, we need trend analysis
-            if state.get("timeframe") in ["historical", "trend"] and not has_growthepie_analysis:
-                raise ValueError("Trend analysis must be completed for historical/trend analysis")
-
-            # For regular analysis, we need category and contract reports
-            if state.get("timeframe") not in ["historical", "trend"] and (not has_category_reports or not has_contract_reports):
-                raise ValueError("Both category and contract analysis must be completed before strategic synthesis")
-
-            category_reports = state.get("category_reports", [])
-            contract_reports = state.get("contract_reports", [])
-            growthepie_analysis = state.get("growthepie_analysis")
-
-            # Generate strategic synthesis
-            # synthesis = StrategicSynthesisReport(
-            #     executive_summary=self._generate_executive_summary(category_reports, contract_reports),
-            #     competitive_landscape_analysis=self._analyze_competitive_landscape(category_reports, contract_reports),
-            #     category_performance_insights=self._analyze_category_performance(category_reports),
-            #     contract_activity_insights=self._analyze_contract_activities(contract_reports),
-            #     revenue_growth_hypotheses=self._generate_growth_hypotheses(category_reports, contract_reports),
-            #     strategic_recommendations=self._generate_strategic_recommendations(category_reports, contract_reports),
-            #     risk_assessment=self._assess_risks(category_reports, contract_reports),
-            #     actionable_next_steps=self._generate_next_steps(category_reports, contract_reports),
-            #     cross_blockchain_comparison=self._compare_blockchains(category_reports, contract_reports)
-            # )
-
-
-            # Parse the reports into the system prompt and call the agent
-            system_prompt = self._get_system_prompt()
-            # import reports.yaml from the schemas folder and add it to the system prompt
-            import os
-            with open(os.path.join(os.path.dirname(__file__), "..", "schemas", "reports.yaml"), "r") as f:
-                reports_yaml = f.read()
-            system_prompt += f"\n\nReports schema: {reports_yaml}"
-            
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=f"Category reports: {category_reports}"),
-                HumanMessage(content=f"Contract reports: {contract_reports}")
-            ]
-            
-            # Add growthepie analysis if available
-            if growthepie_analysis:
-                messages.append(HumanMessage(content=f"Growthepie historical analysis: {growthepie_analysis}"))
-
-            response = self.agent.invoke({"messages": messages})
-            updated_state = state.copy()
-            updated_state["messages"] = response["messages"]
-
-            llm_content = response["messages"][-1].content.lower()
-            # logger.info(f"Strategic Editor Agent: LLM Response: {llm_content}")
-
-            # Update state
-            updated_state = state.copy()
-            updated_state["strategic_synthesis"] = llm_content
-            updated_state["current_task"] = "synthesis_complete"
-
-            logger.info("Strategic synthesis completed successfully")
-            logger.info(f"Strategic synthesis: {updated_state['strategic_synthesis']}")
-            return updated_state
+            messages = self._prepare_synthesis(state)
+            if not state.get("use_cache", False):
+                return self._apply_synthesis_response(state, self.agent.invoke({"messages": messages}))
+
+            key = self._synthesis_cache_key(messages)
+            response = _synthesis_response_cache.get(key)
+            if response is None:
+                response = self.agent.invoke({"messages": messages})
+                _synthesis_response_cache.set(key, response)
+            else:
+                logger.info("♻️ Reusing cached strategic synthesis for identical reports")
+            # Hand out a copy so the messages merged into this run's state are not shared with later hits
+            return self._apply_synthesis_response(state, copy.deepcopy(response))
 
         except Exception as e:
-            logger.error(f"Strategic synthesis error: {str(e)}")
-            updated_state = state.copy()
-            updated_state["errors"].append(f"Strategic Synthesis: {str(e)}")
-            return updated_state
-
-    def _generate_executive_summary(self, category_reports, contract_reports) -> str:
-        """Generate high-level executive summary"""
-        blockchains = [report.blockchain for report in category_reports]
+            logger.error("Strategic synthesis error: %s", e)
+            return error_update(state, "Strategic Synthesis", e)
+
+    def build_synthesis_report(self, category_reports, contract_reports) -> StrategicSynthesisReport:
+        """Build the rule-based synthesis report from the analysis reports, aggregating them once for all helpers"""
+        cache = self._precompute(category_reports, contract_reports)
+        return StrategicSynthesisReport(
+            executive_summary=self._generate_executive_summary(cache),
+            competitive_landscape_analysis=self._analyze_competitive_landscape(cache),
+            category_performance_insights=self._analyze_category_performance(cache),
+            contract_activity_insights=self._analyze_contract_activities(cache),
+            revenue_growth_hypotheses=self._generate_growth_hypotheses(cache),
+            strategic_recommendations=self._generate_strategic_recommendations(cache),
+            risk_assessment=self._assess_risks(cache),
+            actionable_next_steps=self._generate_next_steps(cache),
+            cross_blockchain_comparison=self._compare_blockchains(cache)
+        )
 
-        # Identify market leaders by total gas fees
-        top_blockchain = max(category_reports, key=lambda r: r.total_gas_fees_usd)
+    def _precompute(self, category_reports, contract_reports) -> "SynthesisCache":
+        """Aggregate everything the synthesis helpers need in a single pass over the reports"""
+        cache = SynthesisCache(category_reports=category_reports, contract_reports=contract_reports)
+        category_aggregates = cache.category_aggregates
 
-        # Identify most active category across all chains
-        all_categories = {}
         for report in category_reports:
-            for category, share in report.category_breakdown.items():
-                all_categories[category] = all_categories.get(category, []) + [share]
+            concentration = report.category_concentration
 
-        top_category = max(all_categories.keys(), key=lambda k: sum(all_categories[k]) / len(all_categories[k]))
+            if cache.max_by_fees is None or report.total_gas_fees_usd > cache.max_by_fees.total_gas_fees_usd:
+                cache.max_by_fees = report
+            if cache.min_by_concentration is None or concentration < cache.min_by_concentration.category_concentration:
+                cache.min_by_concentration = report
+            if concentration > 80:
+                cache.high_risk_chains.append(report)
+            if concentration < 65:
+                cache.diverse_chains.append(report.blockchain)
 
-        summary = f"""Strategic analysis of {len(blockchains)} blockchain ecosystems reveals {top_blockchain.blockchain.title()} as the market leader with ${top_blockchain.total_gas_fees_usd:,.0f} in gas fees over {top_blockchain.timeframe}. 
+            if report.defi_share > 40:
+                cache.defi_leaders.append(report.blockchain)
+
+            # Walk the breakdown once for running per-category stats and the smallest underserved category
+            for category, share in report.category_breakdown.items():
+                stats = category_aggregates[category]
+                stats[0] += share
+                stats[1] += 1
+                if share > stats[2]:
+                    stats[2] = share
+                if share < 10 and category not in _EXCLUDED_CATEGORIES:
+                    if cache.top_opportunity is None or share < cache.top_opportunity[2]:
+                        cache.top_opportunity = (report.blockchain, category, share)
+
+        cache.sorted_by_fees = sorted(category_reports, key=attrgetter("total_gas_fees_usd"), reverse=True)
+
+        # Argmax over the running means
+        best_mean = None
+        for category, (total, count, _) in category_aggregates.items():
+            mean = total / count
+            if best_mean is None or mean > best_mean:
+                cache.top_category, best_mean = category, mean
+
+        return cache
+
+    def _generate_executive_summary(self, cache: "SynthesisCache") -> str:
+        """Generate high-level executive summary"""
+        # Market leader by total gas fees and most active category across all chains
+        top_blockchain = cache.max_by_fees
+        top_category = cache.top_category
+        if top_blockchain is None or top_category is None:
+            return ""
+
+        summary = f"""Strategic analysis of {len(cache.category_reports)} blockchain ecosystems reveals {top_blockchain.display_name} as the market leader with ${top_blockchain.total_gas_fees_usd:,.0f} in gas fees over {top_blockchain.timeframe}. 
 
 {top_category.upper()} emerges as the dominant category across chains, indicating strong institutional adoption and mature financial infrastructure. Contract-level analysis shows varying degrees of protocol concentration, with implications for ecosystem resilience and competitive positioning.
 
@@ -174,159 +320,146 @@ Key strategic opportunities exist in underserved categories and emerging protoco
 
         return summary
 
-    def _analyze_competitive_landscape(self, category_reports, contract_reports) -> str:
+    def _analyze_competitive_landscape(self, cache: "SynthesisCache") -> str:
         """Analyze competitive positioning between blockchains"""
-        analysis = "Competitive landscape analysis:"
+        if not cache.category_reports:
+            return ""
 
-        # Sort blockchains by total revenue
-        sorted_blockchains = sorted(category_reports, key=lambda r: r.total_gas_fees_usd, reverse=True)
+        parts = ["Competitive landscape analysis:\n\n"]
 
-        for i, report in enumerate(sorted_blockchains):
+        # Blockchains sorted by total revenue
+        for i, report in enumerate(cache.sorted_by_fees):
             rank = i + 1
-            analysis += f"{rank}. {report.blockchain.title()}: ${report.total_gas_fees_usd:,.0f} total fees, "
-            analysis += f"{report.top_category} dominance ({report.top_category_share:.1f}%), "
-            analysis += f"concentration ratio {report.category_concentration:.1f}%"
+            parts.append(
+                f"{rank}. {report.display_name}: ${report.total_gas_fees_usd:,.0f} total fees, "
+                f"{report.top_category} dominance ({report.top_category_share:.1f}%), "
+                f"concentration ratio {report.category_concentration:.1f}%\n"
+            )
 
-        analysis += "Competitive insights:"
+        parts.append("\nCompetitive insights:\n")
 
         # Identify specializations
-        for report in category_reports:
-            if report.category_breakdown.get("defi", 0) > 45:
-                analysis += f"- {report.blockchain.title()}: DeFi specialist with strong financial infrastructur\n"
-            elif report.category_breakdown.get("nft", 0) > 25:
-                analysis += f"- {report.blockchain.title()}: Strong creator economy and digital asset focus\n"
-            elif report.category_concentration < 60:
-                analysis += f"- {report.blockchain.title()}: Diversified ecosystem with balanced category distribution\n"
+        for report in cache.category_reports:
+            if report.defi_share > 45:
+                parts.append(f"- {report.display_name}: DeFi specialist with strong financial infrastructure\n")
+            elif report.nft_share > 25:
+                parts.append(f"- {report.display_name}: Strong creator economy and digital asset focus\n")
+            elif report.risk_profile == "diversified":
+                parts.append(f"- {report.display_name}: Diversified ecosystem with balanced category distribution\n")
 
-        return analysis
+        return "".join(parts)
 
-    def _analyze_category_performance(self, category_reports) -> str:
+    def _analyze_category_performance(self, cache: "SynthesisCache") -> str:
         """Analyze category performance insights"""
-        analysis = "Category performance reveals ecosystem maturity and specialization patterns:\n\n"
+        if not cache.category_aggregates:
+            return ""
 
-        # Aggregate category data across all blockchains
-        category_aggregates = {}
-        for report in category_reports:
-            for category, share in report.category_breakdown.items():
-                if category not in category_aggregates:
-                    category_aggregates[category] = []
-                category_aggregates[category].append(share)
+        parts = ["Category performance reveals ecosystem maturity and specialization patterns:\n\n"]
 
-        # Analyze each category
-        for category, shares in category_aggregates.items():
-            avg_share = sum(shares) / len(shares)
-            max_share = max(shares)
-            analysis += f"- {category.upper()}: Average {avg_share:.1f}% across chains (max {max_share:.1f}%)\n"
+        # Analyze each category from the aggregated (sum, count, max) stats, picking out emerging ones in the same pass
+        emerging_categories = []
+        for category, (total, count, max_share) in cache.category_aggregates.items():
+            avg_share = total / count
+            parts.append(f"- {category.upper()}: Average {avg_share:.1f}% across chains (max {max_share:.1f}%)\n")
+            if max_share > avg_share * 2:
+                emerging_categories.append(category)
 
-        analysis += "\nStrategic implications:\n"
+        parts.append("\nStrategic implications:\n")
 
-        top_category = max(category_aggregates.keys(), key=lambda k: sum(category_aggregates[k]) / len(category_aggregates[k]))
-        analysis += f"- {top_category.upper()} dominance suggests mature market with established protocols\n"
+        parts.append(f"- {cache.top_category.upper()} dominance suggests mature market with established protocols\n")
 
-        emerging_categories = [cat for cat, shares in category_aggregates.items() if max(shares) > sum(shares)/len(shares) * 2]
         if emerging_categories:
-            analysis += f"- Emerging opportunities in: {', '.join(emerging_categories)}\n"
+            parts.append(f"- Emerging opportunities in: {', '.join(emerging_categories)}\n")
 
-        return analysis
+        return "".join(parts)
 
-    def _analyze_contract_activities(self, contract_reports) -> str:
+    def _analyze_contract_activities(self, cache: "SynthesisCache") -> str:
         """Analyze contract activity patterns"""
-        analysis = "Contract activity analysis reveals protocol dominance and revenue patterns:\n\n"
+        contract_reports = cache.contract_reports
+        if not contract_reports:
+            return ""
 
-        # Analyze concentration across all reports
-        high_concentration = [r for r in contract_reports if r.contract_concentration > 75]
-        balanced_distribution = [r for r in contract_reports if r.contract_concentration <= 60]
+        parts = ["Contract activity analysis reveals protocol dominance and revenue patterns:\n\n"]
 
-        analysis += f"Protocol concentration patterns:\n"
-        analysis += f"- High concentration (>75%): {len(high_concentration)} category-blockchain combinations\n"
-        analysis += f"- Balanced distribution (≤60%): {len(balanced_distribution)} category-blockchain combinations\n\n"
+        # Tally concentration buckets, and collect dominant protocols by the top contract's share of its category's gas fees
+        concentration_counts = Counter(_concentration_bucket(report.contract_concentration) for report in contract_reports)
+        top_contracts = [
+            (report.blockchain, report.category, report.top_contracts[0].name, report.top_contract_share)
+            for report in contract_reports if report.top_contracts
+        ]
 
-        # Identify dominant protocols
-        top_contracts = []
-        for report in contract_reports:
-            if report.top_contracts:
-                top_contract = report.top_contracts[0]
-                top_contracts.append((report.blockchain, report.category, top_contract.name, top_contract.percentage_share))
+        parts.append("Protocol concentration patterns:\n")
+        parts.append(f"- High concentration (>75%): {concentration_counts['high']} category-blockchain combinations\n")
+        parts.append(f"- Balanced distribution (≤60%): {concentration_counts['balanced']} category-blockchain combinations\n\n")
 
-        analysis += "Dominant protocols by category:\n"
-        for blockchain, category, name, share in sorted(top_contracts, key=lambda x: x[3], reverse=True)[:5]:
-            analysis += f"- {name or 'Anonymous'} ({blockchain}/{category}): {share:.1f}% market share\n"
+        parts.append("Dominant protocols by category:\n")
+        for blockchain, category, name, share in nlargest(5, top_contracts, key=itemgetter(3)):
+            parts.append(f"- {name or 'Anonymous'} ({blockchain}/{category}): {share:.1f}% market share\n")
 
-        return analysis
+        return "".join(parts)
 
-    def _generate_growth_hypotheses(self, category_reports, contract_reports) -> List[str]:
+    def _generate_growth_hypotheses(self, cache: "SynthesisCache") -> List[str]:
         """Generate data-driven growth hypotheses"""
         hypotheses = []
 
         # Ecosystem diversification hypothesis
-        diverse_chains = [r.blockchain for r in category_reports if r.category_concentration < 65]
-        if diverse_chains:
-            hypotheses.append(f"Diversified ecosystems ({', '.join(diverse_chains)}) show resilience and multi-use adoption patterns, suggesting sustainable growth potential")
+        if cache.diverse_chains:
+            hypotheses.append(f"Diversified ecosystems ({', '.join(cache.diverse_chains)}) show resilience and multi-use adoption patterns, suggesting sustainable growth potential")
 
         # DeFi maturity hypothesis
-        defi_leaders = [r.blockchain for r in category_reports if r.category_breakdown.get("defi", 0) > 40]
-        if defi_leaders:
-            hypotheses.append(f"Strong DeFi presence in {', '.join(defi_leaders)} indicates institutional adoption readiness and financial infrastructure maturity")
+        if cache.defi_leaders:
+            hypotheses.append(f"Strong DeFi presence in {', '.join(cache.defi_leaders)} indicates institutional adoption readiness and financial infrastructure maturity")
 
         # Protocol concentration hypothesis
-        concentrated_protocols = [r for r in contract_reports if r.top_contract_share > 30]
-        if concentrated_protocols:
+        if any(r.top_contract_share > 30 for r in cache.contract_reports):
             hypotheses.append("High protocol concentration suggests winner-take-all dynamics in certain categories, creating moat opportunities for dominant players")
 
         return hypotheses
 
-    def _generate_strategic_recommendations(self, category_reports, contract_reports) -> List[str]:
+    def _generate_strategic_recommendations(self, cache: "SynthesisCache") -> List[str]:
         """Generate specific strategic recommendations"""
         recommendations = []
 
         # Market entry recommendations
-        lowest_concentration = min(category_reports, key=lambda r: r.category_concentration)
-        recommendations.append(f"Consider {lowest_concentration.blockchain} for diversified market entry due to balanced ecosystem ({lowest_concentration.category_concentration:.1f}% concentration)")
+        lowest_concentration = cache.min_by_concentration
+        if lowest_concentration is not None:
+            recommendations.append(f"Consider {lowest_concentration.blockchain} for diversified market entry due to balanced ecosystem ({lowest_concentration.category_concentration:.1f}% concentration)")
 
         # Category opportunity recommendations
-        underserved_categories = []
-        for report in category_reports:
-            for category, share in report.category_breakdown.items():
-                if share < 10 and category not in ["unlabeled", "token_transfers"]:
-                    underserved_categories.append((report.blockchain, category, share))
-
-        if underserved_categories:
-            top_opportunity = min(underserved_categories, key=lambda x: x[2])
+        top_opportunity = cache.top_opportunity
+        if top_opportunity:
             recommendations.append(f"Target {top_opportunity[1]} category on {top_opportunity[0]} ({top_opportunity[2]:.1f}% current share) for first-mover advantage")
 
         # Risk mitigation recommendations
-        high_risk_chains = [r.blockchain for r in category_reports if r.category_concentration > 80]
-        if high_risk_chains:
-            recommendations.append(f"Implement diversification strategies for exposure to {', '.join(high_risk_chains)} due to high category concentration risk")
+        if cache.high_risk_chains:
+            recommendations.append(f"Implement diversification strategies for exposure to {', '.join(r.blockchain for r in cache.high_risk_chains)} due to high category concentration risk")
 
         return recommendations
 
-    def _assess_risks(self, category_reports, contract_reports) -> str:
+    def _assess_risks(self, cache: "SynthesisCache") -> str:
         """Assess strategic and competitive risks"""
-        risk_analysis = "Risk assessment identifies concentration and competitive threats:\n"
+        parts = ["Risk assessment identifies concentration and competitive threats:\n"]
 
         # Category concentration risks
-        high_risk_chains = [r for r in category_reports if r.category_concentration > 80]
-        if high_risk_chains:
-            risk_analysis += "Category concentration risks:\n"
-            for report in high_risk_chains:
-                risk_analysis += f"- {report.blockchain}: {report.category_concentration:.1f}% concentration in top 3 categories creates ecosystem vulnerability\n"
+        if cache.high_risk_chains:
+            parts.append("Category concentration risks:\n")
+            for report in cache.high_risk_chains:
+                parts.append(f"- {report.blockchain}: {report.category_concentration:.1f}% concentration in top 3 categories creates ecosystem vulnerability\n")
 
         # Protocol concentration risks  
-        high_protocol_risk = [r for r in contract_reports if r.contract_concentration > 80]
-        if high_protocol_risk:
-            risk_analysis += "\nProtocol concentration risks:\n"
-            for report in high_protocol_risk:
-                risk_analysis += f"- {report.blockchain}/{report.category}: {report.contract_concentration:.1f}% concentration in top contracts\n"
+        protocol_risk_lines = [
+            f"- {report.blockchain}/{report.category}: {report.contract_concentration:.1f}% concentration in top contracts\n"
+            for report in cache.contract_reports if report.contract_concentration > 80
+        ]
+        if protocol_risk_lines:
+            parts.append("\nProtocol concentration risks:\n")
+            parts.extend(protocol_risk_lines)
 
-        risk_analysis += "\nMitigation strategies:\n"
-        risk_analysis += "- Diversify across multiple blockchains and categories\n"
-        risk_analysis += "- Monitor protocol concentration trends for early warning signals\n"
-        risk_analysis += "- Maintain exposure to emerging protocols to capture growth opportunities\n"
+        parts.append(_MITIGATION_STRATEGIES)
 
-        return risk_analysis
+        return "".join(parts)
 
-    def _generate_next_steps(self, category_reports, contract_reports) -> List[str]:
+    def _generate_next_steps(self, cache: "SynthesisCache") -> List[str]:
         """Generate specific, actionable next steps"""
         next_steps = []
 
@@ -334,50 +467,50 @@ Key strategic opportunities exist in underserved categories and emerging protoco
         next_steps.append("Implement continuous monitoring of gas fees and category distributions across analyzed blockchains")
 
         # Market research next steps
-        top_blockchain = max(category_reports, key=lambda r: r.total_gas_fees_usd)
-        next_steps.append(f"Deep-dive analysis of {top_blockchain.blockchain} ecosystem protocols for partnership opportunities")
+        if cache.max_by_fees is not None:
+            next_steps.append(f"Deep-dive analysis of {cache.max_by_fees.blockchain} ecosystem protocols for partnership opportunities")
 
         # Portfolio construction next steps
         next_steps.append("Develop diversified portfolio allocation model based on category concentration analysis")
 
         # Competitive intelligence next steps
-        dominant_protocols = []
-        for report in contract_reports:
-            if report.top_contracts and report.top_contract_share > 25:
-                dominant_protocols.append(report.top_contracts[0].name)
+        # Deduplicated in first-seen order so the same reports always produce the same text
+        dominant_protocols = dict.fromkeys(
+            report.top_contracts[0].name or "Anonymous" for report in cache.contract_reports
+            if report.top_contracts and report.top_contract_share > 25
+        )
 
         if dominant_protocols:
-            next_steps.append(f"Competitive analysis of dominant protocols: {', '.join(set(dominant_protocols))}")
+            next_steps.append(f"Competitive analysis of dominant protocols: {', '.join(dominant_protocols)}")
 
         return next_steps
 
-    def _compare_blockchains(self, category_reports, contract_reports) -> str:
+    def _compare_blockchains(self, cache: "SynthesisCache") -> str:
         """Generate direct blockchain comparison"""
-        comparison = "Cross-blockchain comparative analysis:\n\n"
+        if not cache.category_reports:
+            return ""
+
+        parts = ["Cross-blockchain comparative analysis:\n\n"]
 
         # Performance ranking
-        sorted_chains = sorted(category_reports, key=lambda r: r.total_gas_fees_usd, reverse=True)
-        comparison += "Revenue performance ranking:\n"
-        for i, report in enumerate(sorted_chains):
-            comparison += f"{i+1}. {report.blockchain.title()}: ${report.total_gas_fees_usd:,.0f}\n"
+        parts.append("Revenue performance ranking:\n")
+        for i, report in enumerate(cache.sorted_by_fees):
+            parts.append(f"{i+1}. {report.display_name}: ${report.total_gas_fees_usd:,.0f}\n")
 
         # Specialization comparison
-        comparison += "\nEcosystem specializations:\n"
-        for report in category_reports:
-            specialization = max(report.category_breakdown.items(), key=lambda x: x[1])
-            comparison += f"- {report.blockchain.title()}: {specialization[0]} specialist ({specialization[1]:.1f}%)\n"
+        parts.append("\nEcosystem specializations:\n")
+        for report in cache.category_reports:
+            if not report.category_breakdown:
+                continue
+            specialization = report.specialization
+            parts.append(f"- {report.display_name}: {specialization[0]} specialist ({specialization[1]:.1f}%)\n")
 
         # Risk-return profiles
-        comparison += "\nRisk-return profiles:\n"
-        for report in category_reports:
-            if report.category_concentration > 75:
-                profile = "High concentration, specialized ecosystem"
-            elif report.category_concentration < 60:
-                profile = "Diversified, balanced ecosystem"
-            else:
-                profile = "Moderate concentration, emerging specialization"
-            comparison += f"- {report.blockchain.title()}: {profile}\n"
-        return comparison
+        parts.append("\nRisk-return profiles:\n")
+        for report in cache.category_reports:
+            profile = _RISK_PROFILE_LABELS[report.risk_profile]
+            parts.append(f"- {report.display_name}: {profile}\n")
+        return "".join(parts)
 
     def __call__(self, state: AnalysisState) -> Dict[str, Any]:
         """Execute strategic synthesis"""
@@ -385,7 +518,5 @@ Key strategic opportunities exist in underserved categories and emerging protoco
             return self.execute_strategic_synthesis(state)
 
         except Exception as e:
-            logger.error(f"Strategic Editor Agent error: {str(e)}")
-            updated_state = state.copy()
-            updated_state["errors"].append(f"Strategic Editor Agent: {str(e)}")
-            return updated_state
\ No newline at end of file
+            logger.error("Strategic Editor Agent error: %s", e)
+            return error_update(state, "Strategic Editor Agent", e)
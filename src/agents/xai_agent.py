@@ -1,28 +1,18 @@
 import os
 
-from xai_sdk import Client
-from xai_sdk.chat import user
-from xai_sdk.search import SearchParameters, x_source
-from dotenv import load_dotenv
 from datetime import datetime
+from functools import lru_cache
 
 
-load_dotenv()
+@lru_cache(maxsize=1)
+def _get_client():
+    """Create the xAI client on first use so importing this module makes no API setup or network calls"""
+    from dotenv import load_dotenv
+    from xai_sdk import Client
 
-client = Client(api_key=os.getenv("XAI_API_KEY"))
+    load_dotenv()
+    return Client(api_key=os.getenv("XAI_API_KEY"))
 
-chat = client.chat.create(
-    model="grok-4",
-    search_parameters=SearchParameters(
-        mode="auto",
-        return_citations=True,
-        sources=[x_source(included_x_handles=["arbitrum"])],
-        from_date=datetime(2025, 1, 1),
-        to_date=datetime(2025, 7, 23),
-        max_search_results=30
-        ),
-
-)
 
 system_prompt = """You are a blockchain research expert that is capable of analyzing protocol updates and you can reason about the impact of these updates on the blockchain ecosystem for the year 2025.
 
@@ -52,8 +42,30 @@ Blockchain: {blockchain_name}
 # Blockchain: {blockchain_name}
 # """
 
-chat.append(user(system_prompt.format(blockchain_name="Arbitrum")))
+def run(blockchain_name: str, x_handle: str = "arbitrum"):
+    """Ask grok for a chronological report of the blockchain's 2025 updates"""
+    from xai_sdk.chat import user
+    from xai_sdk.search import SearchParameters, x_source
+
+    chat = _get_client().chat.create(
+        model="grok-4",
+        search_parameters=SearchParameters(
+            mode="auto",
+            return_citations=True,
+            sources=[x_source(included_x_handles=[x_handle])],
+            from_date=datetime(2025, 1, 1),
+            to_date=datetime(2025, 7, 23),
+            max_search_results=30
+            ),
+
+    )
+
+    chat.append(user(system_prompt.format(blockchain_name=blockchain_name)))
+
+    return chat.sample()
+
 
-response = chat.sample()
-print(response.content)
-print(response.citations)
\ No newline at end of file
+if __name__ == "__main__":
+    response = run("Arbitrum")
+    print(response.content)
+    print(response.citations)
@@ -4,17 +4,24 @@ Implements the multi-agent supervisor architecture with task delegation.
 """
 
 from typing import Dict, Any, Literal
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, START, END
-from langgraph.prebuilt import create_react_agent
+from langgraph.types import Command
 
-from .agents.project_manager import ProjectManagerAgent
+from .agents.project_manager import ProjectManagerAgent, _trend_response_cache
 from .agents.blockchain_revenue_agent import BlockchainRevenueAgent  
-from .agents.strategic_editor_agent import StrategicEditorAgent
+from .agents.strategic_editor_agent import StrategicEditorAgent, _synthesis_response_cache
 from .agents.growthepie_analysis_agent import TrendAnalysisAgent
 from .schemas.state import AnalysisState
-from .utils.agent_utils import validate_state_inputs, should_continue_analysis, create_error_state
+from .utils.agent_utils import validate_state_inputs, create_error_state
+from .tools.blockchain_tools import ToolResultCache, prefetch_category_data, tool_result_cache
+from .utils.llm_utils import prewarm_http_client
+from pathlib import Path
+import copy
+import hashlib
+import json
 import logging
+import os
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -22,6 +29,62 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+def _result_cache_key(model_name: str, input_data: Dict[str, Any]) -> tuple:
+    """Normalize a workflow request so equivalent inputs (e.g. "Mantle" vs "mantle") share a cache entry"""
+    blockchain_names = sorted({name.strip().lower() for name in input_data.get("blockchain_names", [])})
+    timeframe = input_data.get("timeframe", "7d").strip().lower()
+    metadata = json.dumps(input_data.get("metadata", {}), sort_keys=True, separators=(",", ":"), default=str)
+    return ("workflow", model_name, tuple(blockchain_names), timeframe, metadata)
+
+
+# Rendered workflow graphs keyed by a hash of their mermaid source, stored under the repository root unless GRAPH_CACHE_DIR is set
+_GRAPH_CACHE_DIR = Path(os.getenv("GRAPH_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache"))
+
+
+# Timeframes that add the trend analysis stage
+_TREND_TIMEFRAMES = frozenset({"historical", "trend"})
+
+
+# State fields whose presence means a run can resume without re-planning
+_RESUMABLE_FIELDS = ("category_reports", "contract_reports", "growthepie_analysis")
+
+
+# Scalar starting values shared by every run; mutable fields are created fresh in _build_initial_state
+_INITIAL_STATE_TEMPLATE = {
+    "target_categories": None,
+    "growthepie_insights": None,
+    "strategic_synthesis": None,
+    "current_task": "initial",
+}
+
+
+# Scalar defaults the validator fills in for missing fields; mutable fields are created fresh per run
+_STATE_DEFAULTS = {
+    "growthepie_analysis": None,
+    "target_categories": None,
+    "growthepie_insights": None,
+    "strategic_synthesis": None,
+    "current_task": "validated",
+}
+
+
+def _build_initial_state(input_data: Dict[str, Any]) -> AnalysisState:
+    """Create the starting state for a workflow run from the request, including any results from a previous run"""
+    return AnalysisState(
+        **_INITIAL_STATE_TEMPLATE,
+        blockchain_names=input_data.get("blockchain_names", []),
+        timeframe=input_data.get("timeframe", "7d"),
+        category_reports=list(input_data.get("category_reports", [])),
+        contract_reports=list(input_data.get("contract_reports", [])),
+        growthepie_analysis=input_data.get("growthepie_analysis"),
+        errors=[],
+        warnings=[],
+        messages=[],
+        metadata=input_data.get("metadata", {}),
+        use_cache=input_data.get("cache", False)
+    )
+
+
 class OnchainAnalysisWorkflow:
     """
     Multi-agent workflow for blockchain revenue analysis and competitive intelligence.
@@ -43,8 +106,12 @@ class OnchainAnalysisWorkflow:
         self.strategic_editor_agent = StrategicEditorAgent("gpt-4.1")
         self.trend_analysis_agent = TrendAnalysisAgent(model_name)
 
-        # Build the workflow graph
+        # Build the workflow graph; it is compiled once on first use
         self.workflow = self._build_workflow()
+        self._compiled_workflow = None
+
+        # Completed results keyed by the normalized request, used only when a caller opts in
+        self.result_cache = ToolResultCache(maxsize=32, ttl=3600.0)
 
         logger.info("OnchainAnalysisWorkflow initialized successfully")
 
@@ -55,8 +122,13 @@ class OnchainAnalysisWorkflow:
         workflow = StateGraph(AnalysisState)
 
         # Add agent nodes
-        workflow.add_node("project_manager", self._run_project_manager)
-        workflow.add_node("blockchain_revenue_agent", self._run_blockchain_revenue_agent)
+        workflow.add_node("project_manager", RunnableLambda(self._run_project_manager, afunc=self._arun_project_manager))
+        # ainvoke runs use the revenue agent's async entry point; destinations are declared because RunnableLambda hides the Command return hint
+        workflow.add_node(
+            "blockchain_revenue_agent",
+            RunnableLambda(self._run_blockchain_revenue_agent, afunc=self._arun_blockchain_revenue_agent),
+            destinations=("blockchain_revenue_agent", "project_manager")
+        )
         workflow.add_node("strategic_editor_agent", self._run_strategic_editor_agent)
         workflow.add_node("trend_analysis_agent", self._run_trend_analysis_agent)
         workflow.add_node("validator", self._validate_inputs)
@@ -70,7 +142,13 @@ class OnchainAnalysisWorkflow:
             self._should_proceed_from_validation,
             {
                 "proceed": "project_manager",
-                "error": END
+                "error": END,
+                # A resumed run skips planning and goes straight to its first unfinished stage
+                "project_manager": "project_manager",
+                "blockchain_revenue_agent": "blockchain_revenue_agent",
+                "trend_analysis_agent": "trend_analysis_agent",
+                "strategic_editor_agent": "strategic_editor_agent",
+                "end": END
             }
         )
 
@@ -82,12 +160,12 @@ class OnchainAnalysisWorkflow:
                 "blockchain_revenue_agent": "blockchain_revenue_agent",
                 "trend_analysis_agent": "trend_analysis_agent",
                 "strategic_editor_agent": "strategic_editor_agent", 
+                "project_manager": "project_manager",
                 "end": END
             }
         )
 
-        # Revenue agent routes back to project manager
-        workflow.add_edge("blockchain_revenue_agent", "project_manager")
+        # Revenue agent routes itself with Command: straight on to contract analysis, otherwise back to project manager
 
         # Trend analysis agent routes back to project manager
         workflow.add_edge("trend_analysis_agent", "project_manager")
@@ -105,19 +183,49 @@ class OnchainAnalysisWorkflow:
             logger.info("Project Manager completed successfully")
             return result
         except Exception as e:
-            logger.error(f"Project Manager execution failed: {str(e)}")
+            logger.error("Project Manager execution failed: %s", e)
+            return create_error_state(state, str(e), "project_manager")
+
+    async def _arun_project_manager(self, state: AnalysisState) -> AnalysisState:
+        """Execute the project manager agent without blocking the event loop"""
+        try:
+            logger.info("Executing Project Manager")
+            result = await self.project_manager.acall(state)
+            logger.info("Project Manager completed successfully")
+            return result
+        except Exception as e:
+            logger.error("Project Manager execution failed: %s", e)
             return create_error_state(state, str(e), "project_manager")
 
-    def _run_blockchain_revenue_agent(self, state: AnalysisState) -> AnalysisState:
+    def _run_blockchain_revenue_agent(self, state: AnalysisState) -> Command[Literal["blockchain_revenue_agent", "project_manager"]]:
         """Execute the blockchain revenue agent"""
         try:
             logger.info("Executing Blockchain Revenue Agent")
             result = self.blockchain_revenue_agent(state)
             logger.info("Blockchain Revenue Agent completed successfully")
-            return result
         except Exception as e:
-            logger.error(f"Blockchain Revenue Agent execution failed: {str(e)}")
-            return create_error_state(state, str(e), "blockchain_revenue_agent")
+            logger.error("Blockchain Revenue Agent execution failed: %s", e)
+            return Command(goto="project_manager", update=create_error_state(state, str(e), "blockchain_revenue_agent"))
+        return self._revenue_command(result)
+
+    async def _arun_blockchain_revenue_agent(self, state: AnalysisState) -> Command[Literal["blockchain_revenue_agent", "project_manager"]]:
+        """Execute the blockchain revenue agent without blocking the event loop"""
+        try:
+            logger.info("Executing Blockchain Revenue Agent")
+            result = await self.blockchain_revenue_agent.acall(state)
+            logger.info("Blockchain Revenue Agent completed successfully")
+        except Exception as e:
+            logger.error("Blockchain Revenue Agent execution failed: %s", e)
+            return Command(goto="project_manager", update=create_error_state(state, str(e), "blockchain_revenue_agent"))
+        return self._revenue_command(result)
+
+    @staticmethod
+    def _revenue_command(result: Dict[str, Any]) -> Command[Literal["blockchain_revenue_agent", "project_manager"]]:
+        """Route the revenue agent's update to its next node"""
+        # Contract analysis always follows a successful category analysis, so skip the project manager hop in between
+        if result.get("current_task") == "contract_analysis" and not result.get("errors"):
+            return Command(goto="blockchain_revenue_agent", update=result)
+        return Command(goto="project_manager", update=result)
 
     def _run_strategic_editor_agent(self, state: AnalysisState) -> AnalysisState:
         """Execute the strategic editor agent"""
@@ -127,7 +235,7 @@ class OnchainAnalysisWorkflow:
             logger.info("Strategic Editor Agent completed successfully")
             return result
         except Exception as e:
-            logger.error(f"Strategic Editor Agent execution failed: {str(e)}")
+            logger.error("Strategic Editor Agent execution failed: %s", e)
             return create_error_state(state, str(e), "strategic_editor_agent")
 
     def _run_trend_analysis_agent(self, state: AnalysisState) -> AnalysisState:
@@ -138,7 +246,7 @@ class OnchainAnalysisWorkflow:
             logger.info("Trend Analysis Agent completed successfully")
             return result
         except Exception as e:
-            logger.error(f"Trend Analysis Agent execution failed: {str(e)}")
+            logger.error("Trend Analysis Agent execution failed: %s", e)
             return create_error_state(state, str(e), "trend_analysis_agent")
 
     def _validate_inputs(self, state: AnalysisState) -> AnalysisState:
@@ -148,71 +256,86 @@ class OnchainAnalysisWorkflow:
         is_valid, errors = validate_state_inputs(state)
 
         if not is_valid:
-            logger.error(f"Input validation failed: {errors}")
+            logger.error("Input validation failed: %s", errors)
             error_state = create_error_state(state, f"Input validation failed: {', '.join(errors)}", "validator")
             return error_state
 
         # Initialize state fields if not present
-        updated_state = state.copy()
-        updated_state.setdefault("category_reports", [])
-        updated_state.setdefault("contract_reports", [])
-        updated_state.setdefault("growthepie_analysis", None)
-        updated_state.setdefault("target_categories", None)
-        updated_state.setdefault("growthepie_insights", None)
-        updated_state.setdefault("strategic_synthesis", None)
-        updated_state.setdefault("errors", [])
-        updated_state.setdefault("messages", [])
-        updated_state.setdefault("metadata", {})
-        updated_state.setdefault("current_task", "validated")
+        updated_state = AnalysisState(
+            **_STATE_DEFAULTS,
+            category_reports=[],
+            contract_reports=[],
+            errors=[],
+            warnings=[],
+            messages=[],
+            metadata={}
+        )
+        updated_state.update(state)
+        updated_state["trend_needed"] = updated_state["timeframe"] in _TREND_TIMEFRAMES
+
+        # A retried run that already holds results picks up where it stopped instead of re-planning
+        if any(updated_state.get(key) for key in _RESUMABLE_FIELDS):
+            updated_state["current_task"] = "resumed"
 
         logger.info("Input validation passed")
         return updated_state
 
-    def _should_proceed_from_validation(self, state: AnalysisState) -> Literal["proceed", "error"]:
-        """Determine if workflow should proceed after validation"""
+    def _should_proceed_from_validation(self, state: AnalysisState) -> str:
+        """Determine if workflow should proceed after validation, resuming at the next stage when possible"""
         if state.get("errors"):
             return "error"
+        if state.get("current_task") == "resumed":
+            logger.info("⏩ Resuming workflow from existing results")
+            return self._decide_next(state)
         return "proceed"
 
-    def _route_from_project_manager(self, state: AnalysisState) -> Literal["blockchain_revenue_agent", "growthepie_analysis_agent", "strategic_editor_agent", "end"]:
+    def _route_from_project_manager(self, state: AnalysisState) -> Literal["blockchain_revenue_agent", "trend_analysis_agent", "strategic_editor_agent", "project_manager", "end"]:
         """Route from project manager based on current task state"""
-        current_task = state.get("current_task", "")
-        blockchain_names = state.get("blockchain_names", [])
-        timeframe = state.get("timeframe", "")
+        return self._decide_next(state)
 
-        logger.info(f"🔀 Workflow Routing Decision:")
-        logger.info(f"   📊 Current Task: {current_task}")
-        logger.info(f"   ⛓️  Blockchains: {blockchain_names}")
-        logger.info(f"   ⏰ Timeframe: {timeframe}")
+    def _decide_next(self, state: AnalysisState) -> Literal["blockchain_revenue_agent", "trend_analysis_agent", "strategic_editor_agent", "project_manager", "end"]:
+        """Pick the next node from the results already in the state, without any LLM call"""
+        get = state.get
 
         # Check for errors
-        if state.get("errors"):
-            logger.error(f"❌ Errors detected, ending workflow: {state['errors']}")
+        errors = get("errors")
+        if errors:
+            logger.error("❌ Errors detected, ending workflow: %s", errors)
             return "end"
 
         # Check if trend analysis should be triggered (only if not already completed)
-        has_trend_analysis = bool(state.get("growthepie_analysis"))
+        has_trend_analysis = bool(get("growthepie_analysis"))
         if not has_trend_analysis and self._should_run_trend_analysis(state):
             logger.info("🔄 Routing to Trend Analysis Agent for historical analysis")
             return "trend_analysis_agent"
 
         # Check if trend analysis results need to be analyzed by project manager
-        has_trend_insights = bool(state.get("growthepie_insights"))
+        has_trend_insights = bool(get("growthepie_insights"))
         if has_trend_analysis and not has_trend_insights:
             logger.info("🧠 Routing to Project Manager for trend analysis interpretation")
             return "project_manager"
 
         # Check completion status
-        has_category_reports = bool(state.get("category_reports"))
-        has_contract_reports = bool(state.get("contract_reports"))
-        has_synthesis = bool(state.get("strategic_synthesis"))
-
-        logger.info(f"📈 Analysis Status:")
-        logger.info(f"   📋 Category Reports: {'✅' if has_category_reports else '❌'}")
-        logger.info(f"   📄 Contract Reports: {'✅' if has_contract_reports else '❌'}")
-        logger.info(f"   📊 Trend Analysis: {'✅' if has_trend_analysis else '❌'}")
-        logger.info(f"   🧠 Trend Insights: {'✅' if has_trend_insights else '❌'}")
-        logger.info(f"   📝 Strategic Synthesis: {'✅' if has_synthesis else '❌'}")
+        has_category_reports = bool(get("category_reports"))
+        has_contract_reports = bool(get("contract_reports"))
+        has_synthesis = bool(get("strategic_synthesis"))
+
+        # Short timeframes never get a trend stage, so it must not hold back synthesis
+        if not self._should_run_trend_analysis(state):
+            has_trend_analysis = True
+
+        # The status block is only worth formatting when someone will see it
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔀 Workflow Routing Decision:")
+            logger.info("   📊 Current Task: %s", get("current_task", ""))
+            logger.info("   ⛓️  Blockchains: %s", get("blockchain_names", []))
+            logger.info("   ⏰ Timeframe: %s", get("timeframe", ""))
+            logger.info("📈 Analysis Status:")
+            logger.info("   📋 Category Reports: %s", "✅" if has_category_reports else "❌")
+            logger.info("   📄 Contract Reports: %s", "✅" if has_contract_reports else "❌")
+            logger.info("   📊 Trend Analysis: %s", "✅" if has_trend_analysis else "❌")
+            logger.info("   🧠 Trend Insights: %s", "✅" if has_trend_insights else "❌")
+            logger.info("   📝 Strategic Synthesis: %s", "✅" if has_synthesis else "❌")
 
         # Route to strategic editor if analyses are complete
         if (has_category_reports and has_contract_reports and has_trend_analysis) and not has_synthesis:
@@ -234,54 +357,75 @@ class OnchainAnalysisWorkflow:
         return "blockchain_revenue_agent"
 
     def _should_run_trend_analysis(self, state: AnalysisState) -> bool:
-        """Determine if trend analysis should be triggered based on timeframe"""
-        timeframe = state.get("timeframe", "")
-        return timeframe in ["historical", "trend"]
+        """Determine if trend analysis should be triggered, using the flag set by the validator when it ran"""
+        return state.get("trend_needed", state["timeframe"] in _TREND_TIMEFRAMES)
+
+    def _prefetch(self, input_data: Dict[str, Any]) -> None:
+        """Warm the category data cache and the LLM connection in the background when the caller opts in with "prefetch": True"""
+        if input_data.get("prefetch", False):
+            timeframe = self.blockchain_revenue_agent.analysis_timeframe(input_data.get("timeframe", "7d"))
+            prefetch_category_data(input_data.get("blockchain_names", []), timeframe)
+            # Open the LLM connection so the project manager's first call does not pay for the handshake
+            prewarm_http_client()
+
+    @property
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit and miss counters plus current size of every cache a run can use, keyed by cache"""
+        return {
+            "workflow_results": self.result_cache.stats,
+            "tool_results": tool_result_cache.stats,
+            "trend_responses": _trend_response_cache.stats,
+            "synthesis_responses": _synthesis_response_cache.stats,
+        }
 
     def compile(self):
-        """Compile the workflow for execution"""
-        compiled_workflow = self.workflow.compile()
-        logger.info("Workflow compiled successfully")
-        return compiled_workflow
+        """Compile the workflow for execution, reusing the compiled graph across calls"""
+        if self._compiled_workflow is None:
+            self._compiled_workflow = self.workflow.compile()
+            logger.info("Workflow compiled successfully")
+        return self._compiled_workflow
 
     def invoke(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the complete workflow with input data.
 
         Args:
-            input_data: Dictionary containing blockchain_names and timeframe
+            input_data: Dictionary containing blockchain_names and timeframe;
+                set "cache" to True to reuse the result of an equivalent recent request
+                and "prefetch" to True to start fetching category data and open the LLM connection before the graph runs;
+                category_reports, contract_reports and growthepie_analysis from an earlier
+                run resume the workflow at its first unfinished stage
 
         Returns:
             Complete analysis results including all reports
         """
         try:
-            logger.info(f"Starting workflow execution with input: {input_data}")
-
-            # Create initial state
-            initial_state = AnalysisState(
-                blockchain_names=input_data.get("blockchain_names", []),
-                timeframe=input_data.get("timeframe", "7d"),
-                category_reports=[],
-                contract_reports=[],
-                growthepie_analysis=None,
-                target_categories=None,
-                growthepie_insights=None,
-                strategic_synthesis=None,
-                current_task="initial",
-                errors=[],
-                messages=[],
-                metadata=input_data.get("metadata", {})
-            )
+            logger.info("Starting workflow execution with input: %s", input_data)
+
+            # Reuse the result of an equivalent recent request when the caller opts in
+            use_cache = input_data.get("cache", False)
+            cache_key = _result_cache_key(self.model_name, input_data)
+            cached = self.result_cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                logger.info("♻️ Returning cached workflow result")
+                return copy.deepcopy(cached)
+
+            # Create initial state, optionally warming the category data cache while the project manager plans
+            self._prefetch(input_data)
+            initial_state = _build_initial_state(input_data)
 
             # Compile and execute workflow
             compiled_workflow = self.compile()
             result = compiled_workflow.invoke(initial_state)
+            if use_cache and not result.get("errors"):
+                # Store a private copy so callers mutating the returned result cannot corrupt later hits
+                self.result_cache.set(cache_key, copy.deepcopy(result))
 
             logger.info("Workflow execution completed successfully")
             return result
 
         except Exception as e:
-            logger.error(f"Workflow execution failed: {str(e)}")
+            logger.error("Workflow execution failed: %s", e)
             return {
                 "errors": [f"Workflow execution failed: {str(e)}"],
                 "success": False
@@ -292,39 +436,42 @@ class OnchainAnalysisWorkflow:
         Asynchronously execute the complete workflow.
 
         Args:
-            input_data: Dictionary containing blockchain_names and timeframe
+            input_data: Dictionary containing blockchain_names and timeframe;
+                set "cache" to True to reuse the result of an equivalent recent request
+                and "prefetch" to True to start fetching category data and open the LLM connection before the graph runs;
+                category_reports, contract_reports and growthepie_analysis from an earlier
+                run resume the workflow at its first unfinished stage
 
         Returns:
             Complete analysis results including all reports
         """
         try:
-            logger.info(f"Starting async workflow execution with input: {input_data}")
-
-            # Create initial state
-            initial_state = AnalysisState(
-                blockchain_names=input_data.get("blockchain_names", []),
-                timeframe=input_data.get("timeframe", "7d"),
-                category_reports=[],
-                contract_reports=[],
-                growthepie_analysis=None,
-                target_categories=None,
-                growthepie_insights=None,
-                strategic_synthesis=None,
-                current_task="initial",
-                errors=[],
-                messages=[],
-                metadata=input_data.get("metadata", {})
-            )
+            logger.info("Starting async workflow execution with input: %s", input_data)
+
+            # Reuse the result of an equivalent recent request when the caller opts in
+            use_cache = input_data.get("cache", False)
+            cache_key = _result_cache_key(self.model_name, input_data)
+            cached = self.result_cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                logger.info("♻️ Returning cached async workflow result")
+                return copy.deepcopy(cached)
+
+            # Create initial state, optionally warming the category data cache while the project manager plans
+            self._prefetch(input_data)
+            initial_state = _build_initial_state(input_data)
 
             # Compile and execute workflow
             compiled_workflow = self.compile()
             result = await compiled_workflow.ainvoke(initial_state)
+            if use_cache and not result.get("errors"):
+                # Store a private copy so callers mutating the returned result cannot corrupt later hits
+                self.result_cache.set(cache_key, copy.deepcopy(result))
 
             logger.info("Async workflow execution completed successfully")
             return result
 
         except Exception as e:
-            logger.error(f"Async workflow execution failed: {str(e)}")
+            logger.error("Async workflow execution failed: %s", e)
             return {
                 "errors": [f"Async workflow execution failed: {str(e)}"],
                 "success": False
@@ -341,23 +488,10 @@ class OnchainAnalysisWorkflow:
             Incremental workflow updates
         """
         try:
-            logger.info(f"Starting streaming workflow execution with input: {input_data}")
+            logger.info("Starting streaming workflow execution with input: %s", input_data)
 
             # Create initial state  
-            initial_state = AnalysisState(
-                blockchain_names=input_data.get("blockchain_names", []),
-                timeframe=input_data.get("timeframe", "7d"),
-                category_reports=[],
-                contract_reports=[],
-                growthepie_analysis=None,
-                target_categories=None,
-                growthepie_insights=None,
-                strategic_synthesis=None,
-                current_task="initial",
-                errors=[],
-                messages=[],
-                metadata=input_data.get("metadata", {})
-            )
+            initial_state = _build_initial_state(input_data)
 
             # Compile and stream workflow
             compiled_workflow = self.compile()
@@ -366,7 +500,7 @@ class OnchainAnalysisWorkflow:
                 yield update
 
         except Exception as e:
-            logger.error(f"Streaming workflow execution failed: {str(e)}")
+            logger.error("Streaming workflow execution failed: %s", e)
             yield {
                 "errors": [f"Streaming workflow execution failed: {str(e)}"],
                 "success": False
@@ -381,18 +515,29 @@ class OnchainAnalysisWorkflow:
         """
         try:
             compiled_workflow = self.compile()
-            graph_image = compiled_workflow.get_graph().draw_mermaid_png()
+            graph = compiled_workflow.get_graph()
+
+            # Rendering goes over the network, so reuse a previous render of the same mermaid source
+            mermaid_hash = hashlib.sha256(graph.draw_mermaid().encode()).hexdigest()[:16]
+            cached_image = _GRAPH_CACHE_DIR / f"graph_{mermaid_hash}.png"
+            if cached_image.exists():
+                logger.info("♻️ Reusing cached workflow graph render %s", cached_image)
+                graph_image = cached_image.read_bytes()
+            else:
+                graph_image = graph.draw_mermaid_png()
+                _GRAPH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cached_image.write_bytes(graph_image)
 
             # Save the image
             image_path = "workflow_graph.png"
             with open(image_path, "wb") as f:
                 f.write(graph_image)
 
-            logger.info(f"Workflow graph saved to {image_path}")
+            logger.info("Workflow graph saved to %s", image_path)
             return image_path
 
         except Exception as e:
-            logger.error(f"Graph visualization failed: {str(e)}")
+            logger.error("Graph visualization failed: %s", e)
             return None
 
 
@@ -3,7 +3,11 @@ State definitions for the blockchain revenue analysis system.
 Defines the shared state structure used across all agents and tasks.
 """
 
-from typing import TypedDict, List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Literal
+from typing_extensions import NotRequired, TypedDict
+from dataclasses import dataclass, fields
+from functools import cached_property
+from operator import itemgetter
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -21,19 +25,57 @@ class BlockchainCategoriesReport(BaseModel):
     key_insights: List[str] = Field(description="Analysis of category distribution patterns")
     generated_at: datetime = Field(default_factory=datetime.now)
 
+    @cached_property
+    def display_name(self) -> str:
+        """Title-cased blockchain name used in report text"""
+        return self.blockchain.title()
 
-class ContractInfo(BaseModel):
+    @cached_property
+    def specialization(self) -> Tuple[str, float]:
+        """Category with the largest share and its share"""
+        return max(self.category_breakdown.items(), key=itemgetter(1))
+
+    @cached_property
+    def defi_share(self) -> float:
+        """Percentage share of the defi category"""
+        return self.category_breakdown.get("defi", 0)
+
+    @cached_property
+    def nft_share(self) -> float:
+        """Percentage share of the nft category"""
+        return self.category_breakdown.get("nft", 0)
+
+    @cached_property
+    def risk_profile(self) -> Literal["concentrated", "diversified", "moderate"]:
+        """Bucket for the category concentration ratio"""
+        if self.category_concentration > 75:
+            return "concentrated"
+        if self.category_concentration < 60:
+            return "diversified"
+        return "moderate"
+
+
+@dataclass(slots=True)
+class ContractInfo:
     """Individual contract information"""
     address: str
-    project_name: Optional[str] = None
-    name: Optional[str] = None
     gas_fees_absolute_usd: float
     main_category_key: str
+    project_name: Optional[str] = None
+    name: Optional[str] = None
     sub_category_key: Optional[str] = None
     gas_fees_absolute_eth: Optional[float] = None
     txcount_absolute: Optional[int] = None
     chain: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ContractInfo":
+        """Build a ContractInfo from a tool result row, ignoring unknown keys"""
+        return cls(**{key: data[key] for key in _CONTRACT_INFO_FIELDS if key in data})
+
+
+_CONTRACT_INFO_FIELDS = tuple(field.name for field in fields(ContractInfo))
+
 
 class TopContractsByCategoryReport(BaseModel):
     """Report structure for contract-level analysis within categories"""
@@ -45,7 +87,7 @@ class TopContractsByCategoryReport(BaseModel):
     top_contract_share: float = Field(description="Gas fees share of highest-earning contract")
     contract_concentration: float = Field(description="Concentration ratio of top 5 contracts")
     key_insights: List[str] = Field(description="Contract performance patterns")
-    activity_analysis: List[str] = Field(description="Contract activities analysis")
+    activity_analysis: Sequence[str] = Field(default=(), description="Contract activities analysis")
     generated_at: datetime = Field(default_factory=datetime.now)
 
 
@@ -91,6 +133,9 @@ class AnalysisState(TypedDict):
 
     # System state
     current_task: str
+    trend_needed: NotRequired[bool]  # Set by the validator from the timeframe
+    use_cache: NotRequired[bool]  # Whether agents may reuse LLM responses from earlier runs; set from the request's "cache" flag
     errors: List[str]
+    warnings: List[str]  # Non-fatal problems, such as a blockchain whose data could not be fetched
     messages: List[Dict[str, Any]]
     metadata: Dict[str, Any]
\ No newline at end of file
@@ -5,9 +5,17 @@ These tools provide the actual data fetching capabilities for the agents.
 
 from typing import Dict, List, Any, Optional
 from langchain_core.tools import tool
+import copy
 import requests
 import time
+import heapq
+import json
+import operator
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 import os
 import pandas as pd
@@ -16,12 +24,17 @@ import re
 from langchain.agents.agent_types import AgentType
 from langchain_experimental.agents.agent_toolkits import create_pandas_dataframe_agent
 from langchain_openai import ChatOpenAI
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
 from .category_perc import get_categories_by_gas_fees_share, get_available_blockchains
-from .top_contracts_by_gas_fees import get_top_contracts_by_gas_fees, get_available_timeframes
+from .top_contracts_by_gas_fees import get_top_contracts_by_gas_fees, get_top_contracts_by_gas_fees_batch, get_available_timeframes, load_blockspace_data
 
 logger = logging.getLogger(__name__)
 
+# Directory of cached growthepie CSV exports, resolved once relative to the source tree rather than the working directory
+GROWTHEPIE_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "growthepie_cache"
+
+# Blockspace export read by the contract tools, resolved the same way
+CONTRACTS_BLOCKSPACE_PATH = Path(__file__).resolve().parent.parent / "data" / "new_inspect_blockspace.json"
+
 # Mock API responses for demonstration - replace with actual API calls
 MOCK_CATEGORY_DATA = {
     "ethereum": {
@@ -134,7 +147,7 @@ def top_contracts_by_gas_fees_tool(blockchain_name: str, timeframe: str = "7d",
     Returns a dict with summary and data or error.
     """
     try:
-        json_path = "src/data/new_inspect_blockspace.json"
+        json_path = CONTRACTS_BLOCKSPACE_PATH
         available_blockchains = get_available_blockchains(json_file_path=json_path)
         if blockchain_name.lower() not in [bc.lower() for bc in available_blockchains]:
             return {"error": f"Blockchain '{blockchain_name}' not supported.", "available_blockchains": available_blockchains}
@@ -144,32 +157,75 @@ def top_contracts_by_gas_fees_tool(blockchain_name: str, timeframe: str = "7d",
         if top_n <= 0 or top_n > 100:
             return {"error": f"top_n must be between 1 and 100. Received: {top_n}"}
         df = get_top_contracts_by_gas_fees(blockchain_name.lower(), timeframe, top_n=top_n, main_category_key=main_category_key, json_file_path=json_path)
-        contracts = df.to_dict(orient="records")
-        if not contracts:
-            return {"error": f"No contracts found for {blockchain_name} ({timeframe}){f' and category {main_category_key}' if main_category_key else ''}"}
-        # Compute summary fields
-        total_contracts_analyzed = len(contracts)
-        total_gas_fees = sum(c.get("gas_fees_absolute_usd", 0) for c in contracts)
-        if total_contracts_analyzed > 0 and total_gas_fees > 0:
-            top_contract_share = (contracts[0]["gas_fees_absolute_usd"] / total_gas_fees) * 100
-            contract_concentration = sum(c["gas_fees_absolute_usd"] for c in contracts[:5]) / total_gas_fees * 100
-        else:
-            top_contract_share = 0
-            contract_concentration = 0
-        return {
-            "blockchain": blockchain_name,
-            "timeframe": timeframe,
-            "main_category_key": main_category_key,
-            "top_contracts": contracts,
-            "total_contracts_analyzed": total_contracts_analyzed,
-            "top_contract_share": top_contract_share,
-            "contract_concentration": contract_concentration,
-            "columns": list(df.columns),
-            "error": None
-        }
+        return _summarize_top_contracts(blockchain_name, timeframe, main_category_key, df)
     except Exception as e:
         return {"error": str(e)}
 
+@tool("top_contracts_by_gas_fees_batch_tool")
+def top_contracts_by_gas_fees_batch_tool(pairs: List[Dict[str, Any]], timeframe: str = "7d", top_n: int = 10) -> dict:
+    """
+    Gets top contracts by gas fees for many blockchain/category pairs in one call.
+    Each pair is a dict with "blockchain_name" and an optional "main_category_key".
+    Returns a dict with one result per pair, in pair order, each shaped like top_contracts_by_gas_fees_tool's output.
+    """
+    try:
+        if top_n <= 0 or top_n > 100:
+            return {"error": f"top_n must be between 1 and 100. Received: {top_n}"}
+        json_path = CONTRACTS_BLOCKSPACE_PATH
+        data = load_blockspace_data(json_path)
+        chains = data['data']['chains']
+        available_blockchains = list(chains.keys())
+        supported = {bc.lower() for bc in available_blockchains}
+
+        # Validate each pair up front; only valid ones are looked up in the shared contracts table
+        results: List[Optional[dict]] = [None] * len(pairs)
+        lookups = {}
+        for index, pair in enumerate(pairs):
+            blockchain_name = pair["blockchain_name"]
+            main_category_key = pair.get("main_category_key")
+            if blockchain_name.lower() not in supported:
+                results[index] = {"error": f"Blockchain '{blockchain_name}' not supported.", "available_blockchains": available_blockchains}
+                continue
+            available_timeframes = list(chains.get(blockchain_name.lower(), {}).get('overview', {}).keys())
+            if timeframe not in available_timeframes:
+                results[index] = {"error": f"Timeframe '{timeframe}' not supported for {blockchain_name}.", "available_timeframes": available_timeframes}
+                continue
+            lookups[index] = (blockchain_name.lower(), main_category_key)
+
+        frames = get_top_contracts_by_gas_fees_batch(list(set(lookups.values())), timeframe, top_n=top_n, data=data)
+        for index, lookup in lookups.items():
+            results[index] = _summarize_top_contracts(pairs[index]["blockchain_name"], timeframe, lookup[1], frames[lookup])
+
+        return {"results": results, "error": None}
+    except Exception as e:
+        return {"error": str(e)}
+
+def _summarize_top_contracts(blockchain_name: str, timeframe: str, main_category_key: Optional[str], df: pd.DataFrame) -> dict:
+    """Build the top contracts tool result, with concentration metrics, from a top-N dataframe"""
+    contracts = df.to_dict(orient="records")
+    if not contracts:
+        return {"error": f"No contracts found for {blockchain_name} ({timeframe}){f' and category {main_category_key}' if main_category_key else ''}"}
+    # Compute summary fields
+    total_contracts_analyzed = len(contracts)
+    total_gas_fees = sum(c.get("gas_fees_absolute_usd", 0) for c in contracts)
+    if total_contracts_analyzed > 0 and total_gas_fees > 0:
+        top_contract_share = (contracts[0]["gas_fees_absolute_usd"] / total_gas_fees) * 100
+        contract_concentration = sum(c["gas_fees_absolute_usd"] for c in contracts[:5]) / total_gas_fees * 100
+    else:
+        top_contract_share = 0
+        contract_concentration = 0
+    return {
+        "blockchain": blockchain_name,
+        "timeframe": timeframe,
+        "main_category_key": main_category_key,
+        "top_contracts": contracts,
+        "total_contracts_analyzed": total_contracts_analyzed,
+        "top_contract_share": top_contract_share,
+        "contract_concentration": contract_concentration,
+        "columns": list(df.columns),
+        "error": None
+    }
+
 @tool("available_timeframes_tool")
 def available_timeframes_tool(blockchain_name: str) -> dict:
     """
@@ -185,6 +241,31 @@ def available_timeframes_tool(blockchain_name: str) -> dict:
     except Exception as e:
         return {"error": str(e)}
 
+def _get_tool_llm() -> ChatOpenAI:
+    """Get the chat model shared by the growthepie tools instead of creating one per call"""
+    # Imported here because scripts load this module as the top-level "tools" package, where ..utils is out of reach
+    try:
+        from ..utils.llm_utils import get_chat_model
+    except ImportError:
+        from utils.llm_utils import get_chat_model
+    return get_chat_model("gpt-4", temperature=0)
+
+
+@lru_cache(maxsize=16)
+def _read_csv_at(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Parse a CSV file; the modification time is part of the cache key so edited files are re-read"""
+    return pd.read_csv(path)
+
+
+def read_csv_cached(file_path) -> pd.DataFrame:
+    """
+    Read a CSV into a dataframe, parsing each unchanged file only once.
+    Returns a copy so callers (including the pandas agent) cannot mutate the cached frame.
+    """
+    path = Path(file_path).resolve()
+    return _read_csv_at(str(path), path.stat().st_mtime_ns).copy()
+
+
 @tool("get_latest_growthepie_datasets_tool")
 def get_latest_growthepie_datasets_tool() -> dict:
     """
@@ -192,28 +273,25 @@ def get_latest_growthepie_datasets_tool() -> dict:
     Returns a dict with the loaded dataframes and metadata.
     """
     try:
-        cache_dir = Path("src/data/growthepie_cache")
+        cache_dir = GROWTHEPIE_CACHE_DIR
         
         if not cache_dir.exists():
             return {"error": f"Cache directory {cache_dir} does not exist."}
         
-        # Get all CSV files using DirectoryLoader with TextLoader
-        loader = DirectoryLoader(str(cache_dir), glob="*.csv", loader_cls=TextLoader)
-        docs = loader.load()
+        # List the CSV files; only the names are needed here, so no file contents are read yet
+        csv_files = sorted(cache_dir.glob("*.csv"))
         
-        print(f"DEBUG: DirectoryLoader found {len(docs)} files")
-        for doc in docs:
-            print(f"DEBUG: File: {doc.metadata['source']}")
+        logger.debug("Found %d CSV files: %s", len(csv_files), csv_files)
         
-        if len(docs) < 2:
-            return {"error": f"Not enough CSV files found. Found {len(docs)}, need at least 2."}
+        if len(csv_files) < 2:
+            return {"error": f"Not enough CSV files found. Found {len(csv_files)}, need at least 2."}
         
         # Extract filenames and use LLM to determine latest dates
-        filenames = [doc.metadata["source"].split("/")[-1] for doc in docs]
-        print(f"DEBUG: Extracted filenames: {filenames}")
+        filenames = [csv_file.name for csv_file in csv_files]
+        logger.debug("Extracted filenames: %s", filenames)
         
         # Use LLM to identify the 2 latest files by date with chronological info
-        llm = ChatOpenAI(temperature=0, model="gpt-4")
+        llm = _get_tool_llm()
         
         date_analysis_prompt = f"""Analyze these CSV filenames and identify the 2 files with the latest dates:
 
@@ -246,18 +324,21 @@ Return format: filename1,filename2"""
             else:
                 chronological_order.append({"filename": filename, "order": "unknown", "position": i})
         
-        # Load the identified files
+        # Load the identified files concurrently
+        file_paths = [cache_dir / filename.strip() for filename in latest_filenames]
+        for file_path in file_paths:
+            if not file_path.exists():
+                return {"error": f"File {file_path.name} not found"}
+        
+        with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+            futures = [executor.submit(read_csv_cached, file_path) for file_path in file_paths]
+        
         dataframes = []
         dataframe_names = []
         
-        for i, filename in enumerate(latest_filenames, 1):
-            file_path = cache_dir / filename.strip()
-            
-            if not file_path.exists():
-                return {"error": f"File {filename} not found"}
-            
+        for i, (file_path, future) in enumerate(zip(file_paths, futures), 1):
             try:
-                df = pd.read_csv(file_path)
+                df = future.result()
                 dataframes.append(df)
                 dataframe_names.append(f"df{i}_{file_path.stem}")
                 
@@ -301,11 +382,11 @@ def get_data_overview(file_path: str, dataset_info: dict = None) -> dict:
         dataset_info: Optional metadata about the dataset (filename, order, etc.)
     """
     try:
-        # Load the dataframe from file
-        dataframe = pd.read_csv(file_path)
+        # Load the dataframe from file, reusing the parse from the dataset lookup when the file is unchanged
+        dataframe = read_csv_cached(file_path)
         
         # Initialize the LLM for the agent
-        llm = ChatOpenAI(temperature=0, model="gpt-4")
+        llm = _get_tool_llm()
         
         # Enhanced analysis prompt with chronological context
         dataset_context = ""
@@ -373,7 +454,7 @@ def get_combined_analysis(analysis_1: str, analysis_2: str, dataset_1_info: dict
     """
     try:
         # Initialize the LLM
-        llm = ChatOpenAI(temperature=0, model="gpt-4")
+        llm = _get_tool_llm()
         
         # Enhanced synthesis prompt with chronological context
         order_1 = dataset_1_info.get('order', 'unknown') if dataset_1_info else 'unknown'
@@ -423,5 +504,91 @@ def validate_timeframe(timeframe: str) -> bool:
 
 def get_top_categories(category_data: Dict[str, float], n: int = 2) -> List[str]:
     """Get top N categories by gas fees percentage"""
-    sorted_categories = sorted(category_data.items(), key=lambda x: x[1], reverse=True)
-    return [category for category, _ in sorted_categories[:n]]
\ No newline at end of file
+    top_categories = heapq.nlargest(n, category_data.items(), key=operator.itemgetter(1))
+    return [category for category, _ in top_categories]
+
+
+class ToolResultCache:
+    """Thread-safe in-memory cache with a time-to-live for tool results"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[dict]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: tuple, value: dict) -> None:
+        """Store value under key, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counters plus the current number of entries"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+tool_result_cache = ToolResultCache(maxsize=256, ttl=300.0)
+
+
+def tool_cache_key(tool_obj, kwargs: Dict[str, Any]) -> tuple:
+    """Build a hashable cache key from a tool and its invocation arguments, serialized as compact JSON"""
+    return (tool_obj.name, json.dumps(kwargs, sort_keys=True, separators=(",", ":"), default=str))
+
+
+def cached_invoke(tool_obj, kwargs: Dict[str, Any]) -> dict:
+    """
+    Invoke a tool, reusing the result of an identical recent invocation.
+    Error results are not cached so transient failures are retried on the next call.
+    Returns a copy so callers cannot mutate the cached result.
+    """
+    key = tool_cache_key(tool_obj, kwargs)
+    result = tool_result_cache.get(key)
+    if result is None:
+        result = tool_obj.invoke(kwargs)
+        if result.get("error"):
+            return result
+        tool_result_cache.set(key, result)
+    return copy.deepcopy(result)
+
+
+def prefetch_category_data(blockchain_names: List[str], timeframe: str) -> threading.Thread:
+    """
+    Hydrate the tool result cache with category data for each blockchain in a background thread.
+    Failures are left for the real call to retry and report.
+    """
+    def _hydrate():
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(blockchain_names)))) as executor:
+            for blockchain in blockchain_names:
+                executor.submit(cached_invoke, categories_by_gas_fees_tool, {"blockchain_name": blockchain, "timeframe": timeframe})
+
+    thread = threading.Thread(target=_hydrate, name="category-cache-hydration", daemon=True)
+    thread.start()
+    return thread
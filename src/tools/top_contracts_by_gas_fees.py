@@ -1,6 +1,6 @@
 import json
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 def get_top_contracts_by_gas_fees(
     blockchain_name: str, 
@@ -24,68 +24,115 @@ def get_top_contracts_by_gas_fees(
     """
     
     # Load the JSON data
-    with open(json_file_path, 'r') as f:
-        data = json.load(f)
+    data = load_blockspace_data(json_file_path)
     
     try:
-        # Get all contracts data from all chains and timeframes
-        all_contracts = []
-        
-        for chain_key, chain_data in data['data']['chains'].items():
-            if 'overview' in chain_data and timeframe in chain_data['overview']:
-                timeframe_data = chain_data['overview'][timeframe]
-                
-                # Look for contracts in each category
-                for category_key, category_data in timeframe_data.items():
-                    if category_key == 'types':
-                        continue
-                    
-                    if 'contracts' in category_data:
-                        contracts_data = category_data['contracts']
-                        types = contracts_data['types']
-                        data_rows = contracts_data['data']
-                        
-                        # Create DataFrame for this category
-                        df = pd.DataFrame(data_rows, columns=types)
-                        all_contracts.append(df)
-        
-        if not all_contracts:
+        combined_df = _combine_contracts(data, timeframe)
+        if combined_df.empty:
             print(f"No contracts data found for timeframe '{timeframe}'")
             return pd.DataFrame()
-        
-        # Combine all contracts data
-        combined_df = pd.concat(all_contracts, ignore_index=True)
-        
-        # Filter by blockchain name
-        filtered_df = combined_df[combined_df['chain'] == blockchain_name]
-        
-        if filtered_df.empty:
-            print(f"No contracts found for blockchain '{blockchain_name}' in timeframe '{timeframe}'")
-            return pd.DataFrame()
-        
-        # Filter by main category if specified
-        if main_category_key:
-            filtered_df = filtered_df[filtered_df['main_category_key'] == main_category_key]
-            
-            if filtered_df.empty:
-                print(f"No contracts found for blockchain '{blockchain_name}', timeframe '{timeframe}', and category '{main_category_key}'")
-                return pd.DataFrame()
-        
-        # Sort by gas_fees_absolute_usd in descending order
-        df_sorted = filtered_df.sort_values('gas_fees_absolute_usd', ascending=False)
-        
-        # Select top N contracts and format
-        top_contracts = df_sorted.head(top_n).copy()
-        top_contracts['gas_fees_absolute_usd'] = top_contracts['gas_fees_absolute_usd'].round(2)
-        top_contracts['gas_fees_absolute_eth'] = top_contracts['gas_fees_absolute_eth'].round(6)
-        
-        result_df = top_contracts[['project_name', 'address', 'name', 'main_category_key', 'sub_category_key', 'chain', 'gas_fees_absolute_eth', 'txcount_absolute', 'gas_fees_absolute_usd']]
-        return result_df
+        return _select_top_contracts(combined_df, blockchain_name, timeframe, top_n, main_category_key)
         
     except Exception as e:
         print(f"Error: {e}")
         return pd.DataFrame()
 
+def get_top_contracts_by_gas_fees_batch(
+    requests: List[Tuple[str, Optional[str]]],
+    timeframe: str,
+    json_file_path: str = "inspect_blockspace.json",
+    top_n: int = 10,
+    data: Optional[dict] = None
+) -> Dict[Tuple[str, Optional[str]], pd.DataFrame]:
+    """
+    Get the top contracts for many (blockchain_name, main_category_key) pairs at once.
+    The JSON file is parsed and the contracts table is built a single time for the whole batch.
+    
+    Args:
+        requests: (blockchain_name, main_category_key) pairs; the category may be None for no filter
+        timeframe (str): Time period shared by every request
+        json_file_path (str): Path to the blockspace JSON file, used when data is not given
+        top_n (int): Number of top contracts to return per request
+        data (dict, optional): Already loaded blockspace JSON
+    
+    Returns:
+        Dict mapping each request pair to its DataFrame (empty when nothing matched)
+    """
+    if data is None:
+        data = load_blockspace_data(json_file_path)
+    
+    combined_df = _combine_contracts(data, timeframe)
+    if combined_df.empty:
+        print(f"No contracts data found for timeframe '{timeframe}'")
+        return {request: pd.DataFrame() for request in requests}
+    
+    return {
+        (blockchain_name, main_category_key): _select_top_contracts(combined_df, blockchain_name, timeframe, top_n, main_category_key)
+        for blockchain_name, main_category_key in requests
+    }
+
+def load_blockspace_data(json_file_path: str = "inspect_blockspace.json") -> dict:
+    """Load the blockspace JSON file."""
+    with open(json_file_path, 'r') as f:
+        return json.load(f)
+
+def _combine_contracts(data: dict, timeframe: str) -> pd.DataFrame:
+    """Build one DataFrame of all contracts across chains and categories for a timeframe."""
+    # Get all contracts data from all chains and timeframes
+    all_contracts = []
+    
+    for chain_key, chain_data in data['data']['chains'].items():
+        if 'overview' in chain_data and timeframe in chain_data['overview']:
+            timeframe_data = chain_data['overview'][timeframe]
+            
+            # Look for contracts in each category
+            for category_key, category_data in timeframe_data.items():
+                if category_key == 'types':
+                    continue
+                
+                if 'contracts' in category_data:
+                    contracts_data = category_data['contracts']
+                    types = contracts_data['types']
+                    data_rows = contracts_data['data']
+                    
+                    # Create DataFrame for this category
+                    df = pd.DataFrame(data_rows, columns=types)
+                    all_contracts.append(df)
+    
+    if not all_contracts:
+        return pd.DataFrame()
+    
+    # Combine all contracts data
+    return pd.concat(all_contracts, ignore_index=True)
+
+def _select_top_contracts(combined_df: pd.DataFrame, blockchain_name: str, timeframe: str, top_n: int, main_category_key: Optional[str]) -> pd.DataFrame:
+    """Filter the combined contracts table to one blockchain/category and keep the top N by gas fees."""
+    # Filter by blockchain name
+    filtered_df = combined_df[combined_df['chain'] == blockchain_name]
+    
+    if filtered_df.empty:
+        print(f"No contracts found for blockchain '{blockchain_name}' in timeframe '{timeframe}'")
+        return pd.DataFrame()
+    
+    # Filter by main category if specified
+    if main_category_key:
+        filtered_df = filtered_df[filtered_df['main_category_key'] == main_category_key]
+        
+        if filtered_df.empty:
+            print(f"No contracts found for blockchain '{blockchain_name}', timeframe '{timeframe}', and category '{main_category_key}'")
+            return pd.DataFrame()
+    
+    # Sort by gas_fees_absolute_usd in descending order
+    df_sorted = filtered_df.sort_values('gas_fees_absolute_usd', ascending=False)
+    
+    # Select top N contracts and format
+    top_contracts = df_sorted.head(top_n).copy()
+    top_contracts['gas_fees_absolute_usd'] = top_contracts['gas_fees_absolute_usd'].round(2)
+    top_contracts['gas_fees_absolute_eth'] = top_contracts['gas_fees_absolute_eth'].round(6)
+    
+    result_df = top_contracts[['project_name', 'address', 'name', 'main_category_key', 'sub_category_key', 'chain', 'gas_fees_absolute_eth', 'txcount_absolute', 'gas_fees_absolute_usd']]
+    return result_df
+
 def get_available_blockchains(json_file_path: str = "inspect_blockspace.json") -> List[str]:
     """Get list of available blockchains in the data."""
     with open(json_file_path, 'r') as f:
@@ -41,25 +41,13 @@ def create_handoff_tool(*, agent_name: str, description: str = None) -> Callable
         try:
             logger.info(f"Handing off to {agent_name}: {task_description}")
 
-            # Create tool message for successful transfer
-            tool_message = {
-                "role": "tool",
-                "content": f"Successfully transferred to {agent_name}",
-                "name": name,
-                "tool_call_id": tool_call_id,
-            }
-
             # Create task message for the target agent
             task_message = HumanMessage(content=task_description)
 
-            # Update state for handoff
-            updated_state = state.copy()
-            updated_state["messages"] = state.get("messages", []) + [tool_message]
-            updated_state["current_task"] = f"handed_off_to_{agent_name}"
-
+            # Update only the handed-off keys; the task message replaces the message history for the target agent
             return Command(
                 goto=agent_name,
-                update={**updated_state, "messages": [task_message]},
+                update={"current_task": f"handed_off_to_{agent_name}", "messages": [task_message]},
                 graph=Command.PARENT,
             )
 
@@ -72,13 +60,12 @@ def create_handoff_tool(*, agent_name: str, description: str = None) -> Callable
                 "tool_call_id": tool_call_id,
             }
 
-            updated_state = state.copy()
-            updated_state["errors"] = state.get("errors", []) + [f"Handoff to {agent_name}: {str(e)}"]
-            updated_state["messages"] = state.get("messages", []) + [error_message]
-
             return Command(
                 goto=agent_name,
-                update=updated_state,
+                update={
+                    "errors": state.get("errors", []) + [f"Handoff to {agent_name}: {str(e)}"],
+                    "messages": state.get("messages", []) + [error_message],
+                },
                 graph=Command.PARENT,
             )
 
@@ -136,7 +123,7 @@ def validate_state_inputs(state: AnalysisState) -> tuple[bool, list]:
 
     if not state.get("timeframe"):
         errors.append("timeframe is required")
-    elif state["timeframe"] not in ["1d", "7d", "30d", "historical", "trend"]:
+    elif state["timeframe"] not in {"1d", "7d", "30d", "historical", "trend"}:
         errors.append("timeframe must be one of: 1d, 7d, 30d, historical, trend")
 
     # Validate blockchain names
@@ -210,6 +197,21 @@ def extract_task_parameters(message_content: str) -> Dict[str, Any]:
     return parameters
 
 
+def error_update(state: AnalysisState, agent: str, error: Any) -> Dict[str, Any]:
+    """
+    Build the partial state update that records an error from an agent.
+
+    Args:
+        state: Current state
+        agent: Label of the agent or step that failed
+        error: Error message or exception
+
+    Returns:
+        Update containing only the extended errors list
+    """
+    return {"errors": state.get("errors", []) + [f"{agent}: {error}"]}
+
+
 def create_error_state(state: AnalysisState, error: str, agent: str = "system") -> AnalysisState:
     """
     Create an error state with the given error message.
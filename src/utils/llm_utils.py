@@ -0,0 +1,53 @@
+"""
+Shared LLM clients for the agents.
+Agents that use the same model share one ChatOpenAI instance, and all sync chat model calls share one HTTP connection pool.
+"""
+
+from functools import lru_cache
+from typing import Optional
+import os
+import threading
+import httpx
+from langchain_openai import ChatOpenAI
+
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Get the keep-alive HTTP client shared by every sync chat model call"""
+    return httpx.Client(limits=_HTTP_LIMITS, timeout=60.0)
+
+
+@lru_cache(maxsize=8)
+def get_chat_model(model_name: str, temperature: float = 0.1, seed: Optional[int] = None) -> ChatOpenAI:
+    """Get the shared chat model for a (model name, temperature, seed) combination"""
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        seed=seed,
+        max_retries=2,
+        timeout=60,
+        # Only the sync client is shared; an AsyncClient is bound to the event loop it first ran on,
+        # so async calls keep the per-model client the OpenAI SDK creates
+        http_client=get_http_client()
+    )
+
+
+@lru_cache(maxsize=1)
+def prewarm_http_client() -> threading.Thread:
+    """
+    Open a keep-alive connection to the OpenAI API in a background thread so the first agent call skips the TLS handshake.
+    Runs once per process; failures are ignored and the real call connects as usual.
+    """
+    base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
+
+    def _connect():
+        try:
+            get_http_client().head(f"{base_url}/models", timeout=5.0)
+        except httpx.HTTPError:
+            pass
+
+    thread = threading.Thread(target=_connect, name="openai-connection-prewarm", daemon=True)
+    thread.start()
+    return thread
@@ -32,6 +32,38 @@ def test_top_contracts_by_gas_fees_tool():
     assert isinstance(result["top_contracts"], list)
     print("test_top_contracts_by_gas_fees_tool passed.")
 
+def test_top_contracts_by_gas_fees_batch_tool():
+    result = blockchain_tools.top_contracts_by_gas_fees_batch_tool.invoke({
+        "pairs": [
+            {"blockchain_name": "base", "main_category_key": "defi"},
+            {"blockchain_name": "mantle", "main_category_key": "defi"},
+            {"blockchain_name": "not_a_chain", "main_category_key": "defi"}
+        ],
+        "timeframe": "7d",
+        "top_n": 5
+    })
+    print("top_contracts_by_gas_fees_batch_tool result:", result)
+    assert isinstance(result, dict)
+    assert result["error"] is None
+    assert len(result["results"]) == 3
+    for pair_result, blockchain in zip(result["results"][:2], ["base", "mantle"]):
+        assert pair_result["error"] is None
+        contracts = pair_result["top_contracts"]
+        assert 0 < len(contracts) <= 5
+        assert all(contract["chain"] == blockchain and contract["main_category_key"] == "defi" for contract in contracts)
+        fees = [contract["gas_fees_absolute_usd"] for contract in contracts]
+        assert fees == sorted(fees, reverse=True)
+        assert pair_result["total_contracts_analyzed"] == len(contracts)
+        single = blockchain_tools.top_contracts_by_gas_fees_tool.invoke({
+            "blockchain_name": blockchain,
+            "timeframe": "7d",
+            "top_n": 5,
+            "main_category_key": "defi"
+        })
+        assert [contract["address"] for contract in contracts] == [contract["address"] for contract in single["top_contracts"]]
+    assert result["results"][2]["error"]
+    print("test_top_contracts_by_gas_fees_batch_tool passed.")
+
 def test_available_timeframes_tool():
     result = blockchain_tools.available_timeframes_tool.invoke({"blockchain_name": "mantle"})
     print("available_timeframes_tool result:", result)
@@ -41,9 +73,23 @@ def test_available_timeframes_tool():
     assert isinstance(result["timeframes"], list)
     print("test_available_timeframes_tool passed.")
 
+def test_cached_invoke_returns_copies():
+    blockchain_tools.tool_result_cache.clear()
+    kwargs = {"blockchain_name": "mantle", "timeframe": "7d"}
+    first = blockchain_tools.cached_invoke(blockchain_tools.categories_by_gas_fees_tool, kwargs)
+    first["categories"].clear()
+    hits = blockchain_tools.tool_result_cache.stats["hits"]
+    second = blockchain_tools.cached_invoke(blockchain_tools.categories_by_gas_fees_tool, kwargs)
+    assert second["categories"]
+    assert second == blockchain_tools.categories_by_gas_fees_tool.invoke(kwargs)
+    assert blockchain_tools.tool_result_cache.stats["hits"] == hits + 1
+    print("test_cached_invoke_returns_copies passed.")
+
 if __name__ == "__main__":
     test_categories_by_gas_fees_tool()
     test_available_blockchains_tool()
     test_top_contracts_by_gas_fees_tool()
+    test_top_contracts_by_gas_fees_batch_tool()
     test_available_timeframes_tool()
+    test_cached_invoke_returns_copies()
     print("All tests passed.") 
\ No newline at end of file
@@ -0,0 +1,306 @@
+# Run from the repository root: python -m pytest tests/test_main_workflow.py, or python -m tests.test_main_workflow
+import asyncio
+import os
+from unittest.mock import patch
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from langchain_core.messages import AIMessage
+
+from src import main_workflow
+from src.agents import blockchain_revenue_agent, project_manager, strategic_editor_agent
+from src.schemas.state import BlockchainCategoriesReport, ContractInfo, TopContractsByCategoryReport
+from src.tools import blockchain_tools
+
+
+def _category_data(blockchain_name):
+    return {
+        "blockchain": blockchain_name,
+        "top_category": "defi",
+        "top_category_share": 55.0,
+        "category_breakdown": {"defi": 55.0, "social": 25.0, "cefi": 20.0},
+        "total_gas_fees_usd": 12000.0,
+        "category_concentration": 100.0,
+        "error": None
+    }
+
+
+def _contract_data(blockchain_name, category):
+    return {
+        "blockchain": blockchain_name,
+        "main_category_key": category,
+        "top_contracts": [
+            {"address": "0x1", "gas_fees_absolute_usd": 700.0, "main_category_key": category, "chain": blockchain_name},
+            {"address": "0x2", "gas_fees_absolute_usd": 300.0, "main_category_key": category, "chain": blockchain_name}
+        ],
+        "total_contracts_analyzed": 2,
+        "top_contract_share": 70.0,
+        "contract_concentration": 100.0,
+        "error": None
+    }
+
+
+def _fake_cached_invoke(tool_obj, kwargs):
+    """Serve the revenue agent's tool calls from fixtures; base fails, everything else succeeds"""
+    if tool_obj is blockchain_tools.categories_by_gas_fees_tool:
+        if kwargs["blockchain_name"] == "base":
+            return {"error": "upstream timeout"}
+        return _category_data(kwargs["blockchain_name"])
+    if tool_obj is blockchain_tools.top_contracts_by_gas_fees_batch_tool:
+        return {"results": [_contract_data(pair["blockchain_name"], pair["main_category_key"]) for pair in kwargs["pairs"]], "error": None}
+    raise AssertionError(f"Unexpected tool call: {tool_obj.name}")
+
+
+def _fake_synthesis(calls):
+    def synthesize(state):
+        calls.append(state)
+        return {"strategic_synthesis": "synthesis", "current_task": "synthesis_complete"}
+    return synthesize
+
+
+class _CountingAgent:
+    """Stands in for the synthesis react agent and counts its calls"""
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, payload):
+        self.calls += 1
+        return {"messages": [*payload["messages"], AIMessage(content=f"synthesis {self.calls}")]}
+
+
+def _create_workflow():
+    workflow = main_workflow.create_onchain_analysis_workflow()
+    blockchain_tools.tool_result_cache.clear()
+    return workflow
+
+
+def test_partial_category_failure_still_reaches_synthesis():
+    workflow = _create_workflow()
+    synthesis_calls = []
+    workflow.strategic_editor_agent = _fake_synthesis(synthesis_calls)
+
+    with patch.object(blockchain_revenue_agent, "cached_invoke", _fake_cached_invoke):
+        result = workflow.invoke({"blockchain_names": ["mantle", "base"], "timeframe": "7d"})
+
+    assert result["errors"] == []
+    assert any("base" in warning for warning in result["warnings"])
+    assert [report.blockchain for report in result["category_reports"]] == ["mantle"]
+    assert {report.blockchain for report in result["contract_reports"]} == {"mantle"}
+    assert len(synthesis_calls) == 1
+    assert result["strategic_synthesis"] == "synthesis"
+    print("test_partial_category_failure_still_reaches_synthesis passed.")
+
+
+def test_ainvoke_uses_async_agents():
+    workflow = _create_workflow()
+    synthesis_calls = []
+    workflow.strategic_editor_agent = _fake_synthesis(synthesis_calls)
+
+    def sync_call(self, state):
+        raise AssertionError("ainvoke should use the async entry point")
+
+    with patch.object(blockchain_revenue_agent, "cached_invoke", _fake_cached_invoke), \
+            patch.object(blockchain_revenue_agent.BlockchainRevenueAgent, "__call__", sync_call), \
+            patch.object(project_manager.ProjectManagerAgent, "__call__", sync_call):
+        result = asyncio.run(workflow.ainvoke({"blockchain_names": ["mantle", "base"], "timeframe": "7d"}))
+
+    assert result["errors"] == []
+    assert any("base" in warning for warning in result["warnings"])
+    assert {report.blockchain for report in result["contract_reports"]} == {"mantle"}
+    assert len(synthesis_calls) == 1
+    print("test_ainvoke_uses_async_agents passed.")
+
+
+def test_cache_stats_count_workflow_result_hits():
+    category_report, contract_report = _mantle_reports()
+    workflow = _create_workflow()
+    synthesis_calls = []
+    workflow.strategic_editor_agent = _fake_synthesis(synthesis_calls)
+
+    result = workflow.invoke({
+        "blockchain_names": ["Mantle"],
+        "timeframe": "7d",
+        "category_reports": [category_report],
+        "contract_reports": [contract_report],
+        "cache": True
+    })
+    assert workflow.cache_stats["workflow_results"] == {"hits": 0, "misses": 1, "size": 1}
+
+    # Equivalent requests are served from the cache without running the graph again
+    assert workflow.invoke({"blockchain_names": ["mantle"], "timeframe": "7d", "cache": True}) == result
+    assert workflow.cache_stats["workflow_results"] == {"hits": 1, "misses": 1, "size": 1}
+    assert len(synthesis_calls) == 1
+    assert set(workflow.cache_stats) == {"workflow_results", "tool_results", "trend_responses", "synthesis_responses"}
+    print("test_cache_stats_count_workflow_result_hits passed.")
+
+
+def test_contract_fallback_reports_per_pair_errors():
+    def flaky_cached_invoke(tool_obj, kwargs):
+        if tool_obj is blockchain_tools.top_contracts_by_gas_fees_batch_tool:
+            return {"error": "batch unavailable"}
+        if kwargs["blockchain_name"] == "base":
+            raise RuntimeError("connection reset")
+        return _contract_data(kwargs["blockchain_name"], kwargs["main_category_key"])
+
+    agent = blockchain_revenue_agent.BlockchainRevenueAgent()
+    with patch.object(blockchain_revenue_agent, "cached_invoke", flaky_cached_invoke):
+        results = agent._fetch_contract_results([("mantle", "defi"), ("base", "defi")], "7d")
+
+    assert results[0]["error"] is None
+    assert results[1] == {"error": "connection reset"}
+    print("test_contract_fallback_reports_per_pair_errors passed.")
+
+
+def _mantle_reports():
+    """Category and contract reports for mantle built from the fixtures, as a finished earlier run would leave them"""
+    category_data = _category_data("mantle")
+    contract_data = _contract_data("mantle", "defi")
+    category_report = BlockchainCategoriesReport(
+        blockchain="mantle",
+        timeframe="7d",
+        top_category=category_data["top_category"],
+        top_category_share=category_data["top_category_share"],
+        category_breakdown=category_data["category_breakdown"],
+        total_gas_fees_usd=category_data["total_gas_fees_usd"],
+        category_concentration=category_data["category_concentration"],
+        key_insights=[]
+    )
+    contract_report = TopContractsByCategoryReport(
+        blockchain="mantle",
+        category="defi",
+        timeframe="7d",
+        top_contracts=[ContractInfo.from_dict(contract) for contract in contract_data["top_contracts"]],
+        total_contracts_analyzed=contract_data["total_contracts_analyzed"],
+        top_contract_share=contract_data["top_contract_share"],
+        contract_concentration=contract_data["contract_concentration"],
+        key_insights=[]
+    )
+    return category_report, contract_report
+
+
+def test_async_analysis_matches_sync_analysis():
+    agent = blockchain_revenue_agent.BlockchainRevenueAgent()
+    state = {"blockchain_names": ["mantle", "base"], "timeframe": "7d", "errors": [], "warnings": []}
+
+    with patch.object(blockchain_revenue_agent, "cached_invoke", _fake_cached_invoke):
+        blockchain_tools.tool_result_cache.clear()
+        category_update = asyncio.run(agent.aexecute_category_analysis(state))
+        contract_update = asyncio.run(agent.aexecute_contract_analysis({**state, **category_update}))
+        blockchain_tools.tool_result_cache.clear()
+        sync_category_update = agent.execute_category_analysis(state)
+
+    assert category_update["current_task"] == "category_analysis_complete"
+    assert [report.blockchain for report in category_update["category_reports"]] == ["mantle"]
+    assert category_update["warnings"] == sync_category_update["warnings"]
+    assert [(report.blockchain, report.category) for report in contract_update["contract_reports"]] == [("mantle", "defi"), ("mantle", "social")]
+    print("test_async_analysis_matches_sync_analysis passed.")
+
+
+def test_invoke_resumes_from_prior_reports():
+    category_report, contract_report = _mantle_reports()
+    workflow = _create_workflow()
+    planning_calls = []
+    synthesis_calls = []
+    workflow.project_manager = lambda state: planning_calls.append(state) or {}
+    workflow.strategic_editor_agent = _fake_synthesis(synthesis_calls)
+
+    result = workflow.invoke({
+        "blockchain_names": ["mantle"],
+        "timeframe": "7d",
+        "category_reports": [category_report],
+        "contract_reports": [contract_report]
+    })
+
+    assert planning_calls == []
+    assert len(synthesis_calls) == 1
+    assert synthesis_calls[0]["current_task"] == "resumed"
+    assert synthesis_calls[0]["category_reports"] == [category_report]
+    assert result["strategic_synthesis"] == "synthesis"
+    print("test_invoke_resumes_from_prior_reports passed.")
+
+
+def test_synthesis_cache_is_opt_in_and_returns_copies():
+    category_report, contract_report = _mantle_reports()
+    state = {"timeframe": "7d", "category_reports": [category_report], "contract_reports": [contract_report], "errors": []}
+    editor = strategic_editor_agent.StrategicEditorAgent()
+    editor.agent = _CountingAgent()
+    strategic_editor_agent._synthesis_response_cache.clear()
+
+    editor(state)
+    editor(state)
+    assert editor.agent.calls == 2
+
+    first = editor({**state, "use_cache": True})
+    second = editor({**state, "use_cache": True})
+    assert editor.agent.calls == 3
+    assert first["strategic_synthesis"] == second["strategic_synthesis"] == "synthesis 3"
+    assert first["messages"][-1] is not second["messages"][-1]
+    print("test_synthesis_cache_is_opt_in_and_returns_copies passed.")
+
+
+def test_trend_cache_is_opt_in_and_skipped_when_sampling():
+    class CountingModel:
+        def __init__(self, temperature):
+            self.temperature = temperature
+            self.calls = 0
+
+        def invoke(self, prompt):
+            self.calls += 1
+            return AIMessage(content='["defi"]')
+
+        async def ainvoke(self, prompt):
+            return self.invoke(prompt)
+
+    trend_analysis = {"combined_analysis": "defi grew", "chronological_order": []}
+    project_manager._trend_response_cache.clear()
+    for temperature, use_cache, expected_calls in [(0, False, 2), (0.1, True, 2), (0, True, 1)]:
+        agent = project_manager.ProjectManagerAgent(temperature=temperature)
+        agent.model = CountingModel(temperature)
+        agent.analyze_trend_results(trend_analysis, use_cache)
+        insights = agent.analyze_trend_results(trend_analysis, use_cache)
+        assert agent.model.calls == expected_calls
+        assert insights["target_categories"] == ["defi"]
+    # The async variant shares the same cache, so the last (cacheable) agent is served without another call
+    assert asyncio.run(agent.aanalyze_trend_results(trend_analysis, True))["target_categories"] == ["defi"]
+    assert agent.model.calls == 1
+    print("test_trend_cache_is_opt_in_and_skipped_when_sampling passed.")
+
+
+def test_synthesis_prompt_includes_rule_based_baseline():
+    category_report, contract_report = _mantle_reports()
+    base_report = category_report.model_copy(update={
+        "blockchain": "base",
+        "total_gas_fees_usd": 30000.0,
+        "category_breakdown": {"defi": 30.0, "social": 35.0, "nft": 20.0, "cefi": 15.0},
+        "category_concentration": 58.0
+    })
+    editor = strategic_editor_agent.StrategicEditorAgent()
+
+    report = editor.build_synthesis_report([category_report, base_report], [contract_report])
+    assert report.cross_blockchain_comparison.index("1. Base") < report.cross_blockchain_comparison.index("2. Mantle")
+    assert "Diversified ecosystem" in report.competitive_landscape_analysis
+    assert report.actionable_next_steps[-1] == "Competitive analysis of dominant protocols: Anonymous"
+    assert "High concentration (>75%): 1 category-blockchain" in report.contract_activity_insights
+
+    empty = editor.build_synthesis_report([], [])
+    assert empty.executive_summary == empty.competitive_landscape_analysis == empty.cross_blockchain_comparison == ""
+    assert editor.build_synthesis_report([category_report], []).contract_activity_insights == ""
+
+    state = {"timeframe": "7d", "category_reports": [category_report, base_report], "contract_reports": [contract_report]}
+    prompt = editor._prepare_synthesis(state)[1].content
+    assert "## Rule-Based Baseline" in prompt
+    assert prompt == editor._prepare_synthesis(state)[1].content
+    print("test_synthesis_prompt_includes_rule_based_baseline passed.")
+
+
+if __name__ == "__main__":
+    test_partial_category_failure_still_reaches_synthesis()
+    test_ainvoke_uses_async_agents()
+    test_cache_stats_count_workflow_result_hits()
+    test_contract_fallback_reports_per_pair_errors()
+    test_async_analysis_matches_sync_analysis()
+    test_invoke_resumes_from_prior_reports()
+    test_synthesis_cache_is_opt_in_and_returns_copies()
+    test_trend_cache_is_opt_in_and_skipped_when_sampling()
+    test_synthesis_prompt_includes_rule_based_baseline()
+    print("All tests passed.")